@@ -4,17 +4,34 @@ import re
 from importlib.metadata import PackageNotFoundError, version
 from pathlib import Path
 
-try:
-    __version__ = version("bis_scraper")
-except PackageNotFoundError:
-    # Package is not installed, read from pyproject.toml (source of truth)
+# Matches the top-level version key in pyproject.toml
+_VERSION_RE = re.compile(r"""^version\s*=\s*["']([^"']+)["']""", re.MULTILINE)
+
+_DEFAULT_VERSION = "0.1.0"
+
+
+def _read_version() -> str:
+    """Determine the package version.
+
+    Uses the installed package metadata, falling back to pyproject.toml
+    (the source of truth) when running from an uninstalled checkout.
+
+    Returns:
+        Package version string
+    """
+    try:
+        return version("bis_scraper")
+    except PackageNotFoundError:
+        pass
+
     pyproject_path = Path(__file__).parent.parent / "pyproject.toml"
-    if pyproject_path.exists():
-        content = pyproject_path.read_text()
-        match = re.search(r'version\s*=\s*["\']([^"\']+)["\']', content)
-        if match:
-            __version__ = match.group(1)
-        else:
-            __version__ = "0.1.0"
-    else:
-        __version__ = "0.1.0"
+    try:
+        content = pyproject_path.read_text(encoding="utf-8")
+    except OSError:
+        return _DEFAULT_VERSION
+
+    match = _VERSION_RE.search(content)
+    return match.group(1) if match else _DEFAULT_VERSION
+
+
+__version__ = _read_version()
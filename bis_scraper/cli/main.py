@@ -5,16 +5,28 @@ Default paths:
 - Log directory: ./logs (from the current working directory)
 """
 
+import atexit
 import datetime
 import logging
+import logging.handlers
 import pathlib
 import sys
-from typing import Optional, Tuple
+from typing import Any, Dict, Optional, Tuple
 
 import click
 
 from bis_scraper import __version__
-from bis_scraper.utils.constants import RAW_DATA_DIR
+from bis_scraper.utils.constants import (
+    DATE_CACHE_JOURNAL_NAME,
+    DATE_CACHE_NAME,
+    DEFAULT_PDF_BACKEND,
+    DEFAULT_REQUEST_INTERVAL,
+    DEFAULT_SCRAPE_WORKERS,
+    HTTP_CACHE_EXPIRE_SECONDS,
+    HTTP_CACHE_NAME,
+    PDF_BACKENDS,
+    RAW_DATA_DIR,
+)
 
 
 @click.group()
@@ -34,12 +46,26 @@ from bis_scraper.utils.constants import RAW_DATA_DIR
     help="Directory to store log files (default: ./logs)",
 )
 @click.option("--verbose", "-v", is_flag=True, help="Enable verbose output")
+@click.option(
+    "--log-buffer-size",
+    type=click.IntRange(min=1),
+    default=1024,
+    show_default=True,
+    help="Number of log records buffered in memory before writing to the log file",
+)
+@click.option(
+    "--http-cache/--no-http-cache",
+    default=False,
+    help="Cache successful HTTP responses for a day (requires requests-cache)",
+)
 @click.pass_context
 def main(
     ctx: click.Context,
     data_dir: pathlib.Path,
     log_dir: pathlib.Path,
     verbose: bool,
+    log_buffer_size: int,
+    http_cache: bool,
 ) -> None:
     """BIS Scraper - Download and process central bank speeches.
 
@@ -64,15 +90,46 @@ def main(
     log_level = logging.DEBUG if verbose else logging.INFO
     log_format = "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
 
+    # Buffer file records in memory so that they reach the disk in batches rather
+    # than one write per record; errors are flushed immediately
+    file_handler = logging.FileHandler(log_dir / "bis_scraper.log")
+    file_handler.setFormatter(logging.Formatter(log_format))
+    memory_handler = logging.handlers.MemoryHandler(
+        capacity=log_buffer_size,
+        flushLevel=logging.ERROR,
+        target=file_handler,
+        flushOnClose=True,
+    )
+
     logging.basicConfig(
         level=log_level,
         format=log_format,
         handlers=[
-            logging.FileHandler(log_dir / "bis_scraper.log"),
+            memory_handler,
             logging.StreamHandler(sys.stdout),
         ],
     )
 
+    # Make sure buffered records are written out on exit
+    atexit.register(memory_handler.flush)
+
+    if http_cache:
+        try:
+            import requests_cache  # type: ignore[import-not-found]
+        except ImportError:
+            raise click.UsageError(
+                "--http-cache requires requests-cache "
+                '(pip install "bis-scraper[cache]")'
+            ) from None
+
+        # Transparently caches all requests made by the scrapers; only
+        # successful responses are stored, so missing speeches are re-checked
+        requests_cache.install_cache(
+            str(data_dir / HTTP_CACHE_NAME),
+            backend="sqlite",
+            expire_after=HTTP_CACHE_EXPIRE_SECONDS,
+        )
+
     # Store configuration in context
     ctx.ensure_object(dict)
     ctx.obj["data_dir"] = data_dir
@@ -80,23 +137,146 @@ def main(
     ctx.obj["verbose"] = verbose
 
 
+def _default_scrape_start_date() -> datetime.datetime:
+    """Return the default scraping start date (1 year ago)."""
+    return datetime.datetime.now() - datetime.timedelta(days=365)
+
+
+def _default_scrape_end_date() -> datetime.datetime:
+    """Return the default scraping end date (30 days ago)."""
+    return datetime.datetime.now() - datetime.timedelta(days=30)
+
+
+def _run_scrape(
+    ctx: click.Context,
+    start_date: datetime.datetime,
+    end_date: datetime.datetime,
+    institutions: Tuple[str, ...],
+    force: bool,
+    limit: Optional[int],
+    workers: int,
+    request_interval: float,
+) -> None:
+    """Run the scraping step.
+
+    Args:
+        ctx: Click context holding the global configuration
+        start_date: Start date for speeches
+        end_date: End date for speeches
+        institutions: Specific institutions to scrape (empty = all)
+        force: Force download even if speeches already exist
+        limit: Maximum number of speeches to download in total
+        workers: Number of dates scraped concurrently
+        request_interval: Minimum number of seconds between HTTP requests
+    """
+    from bis_scraper.scrapers.controller import scrape_bis
+
+    data_dir = ctx.obj["data_dir"]
+    log_dir = ctx.obj["log_dir"]
+
+    click.echo("Starting BIS web scraping...")
+    click.echo(f"Data directory: {data_dir.absolute()}")
+    click.echo(f"Date range: {start_date.date()} to {end_date.date()}")
+    scrape_bis(
+        data_dir=data_dir,
+        log_dir=log_dir,
+        start_date=start_date,
+        end_date=end_date,
+        institutions=institutions if institutions else None,
+        force=force,
+        limit=limit,
+        workers=workers,
+        request_interval=request_interval,
+    )
+    click.echo("Scraping completed!")
+
+
+def _run_recategorize(ctx: click.Context, request_interval: float) -> None:
+    """Run the re-categorization step.
+
+    Args:
+        ctx: Click context holding the global configuration
+        request_interval: Minimum number of seconds between HTTP requests
+    """
+    from bis_scraper.scrapers.recategorize import recategorize_unknown_files
+
+    data_dir = ctx.obj["data_dir"]
+
+    click.echo("Re-categorizing files from unknown folder...")
+    click.echo(f"Data directory: {data_dir.absolute()}")
+
+    recategorized_count, remaining_unknown = recategorize_unknown_files(
+        data_dir, request_interval=request_interval
+    )
+
+    if recategorized_count > 0:
+        click.echo(f"Re-categorized {recategorized_count} file(s) from unknown folder")
+    else:
+        click.echo("No files found to re-categorize")
+
+    if remaining_unknown > 0:
+        click.echo(f"{remaining_unknown} file(s) still remain in unknown folder")
+
+    click.echo("Re-categorization completed!")
+
+
+def _run_convert(
+    ctx: click.Context,
+    start_date: Optional[datetime.datetime],
+    end_date: Optional[datetime.datetime],
+    institutions: Tuple[str, ...],
+    force: bool,
+    limit: Optional[int],
+    workers: Optional[int],
+    backend: str,
+) -> None:
+    """Run the PDF to text conversion step.
+
+    Args:
+        ctx: Click context holding the global configuration
+        start_date: Convert only files with date >= this date
+        end_date: Convert only files with date <= this date
+        institutions: Specific institutions to convert (empty = all)
+        force: Force conversion even if text files already exist
+        limit: Maximum number of files to convert per institution
+        workers: Number of worker processes (None = one per CPU core)
+        backend: Text extraction backend
+    """
+    # Import inside function to avoid CLI import-time side effects
+    from bis_scraper.converters.controller import convert_pdfs_dates
+
+    data_dir = ctx.obj["data_dir"]
+    log_dir = ctx.obj["log_dir"]
+
+    click.echo("Starting PDF to text conversion...")
+    click.echo(f"Data directory: {data_dir.absolute()}")
+    convert_pdfs_dates(
+        data_dir=data_dir,
+        log_dir=log_dir,
+        start_date=start_date,
+        end_date=end_date,
+        institutions=institutions if institutions else None,
+        force=force,
+        limit=limit,
+        workers=workers,
+        backend=backend,
+    )
+    click.echo("Conversion completed!")
+
+
 @main.command()
 @click.option(
     "--start-date",
     "-s",
     type=click.DateTime(formats=["%Y-%m-%d"]),
-    default=lambda: (datetime.datetime.now() - datetime.timedelta(days=365)).strftime(
-        "%Y-%m-%d"
-    ),
+    default=lambda: _default_scrape_start_date().strftime("%Y-%m-%d"),
     help="Start date for speeches (YYYY-MM-DD), defaults to 1 year ago",
 )
 @click.option(
     "--end-date",
     "-e",
     type=click.DateTime(formats=["%Y-%m-%d"]),
-    default=lambda: (datetime.datetime.now() - datetime.timedelta(days=30)).strftime(
-        "%Y-%m-%d"
-    ),
+    default=lambda: _default_scrape_end_date().strftime("%Y-%m-%d"),
     help="End date for speeches (YYYY-MM-DD), defaults to 30 days ago",
 )
 @click.option(
@@ -115,7 +295,26 @@ def main(
     "--limit",
     type=int,
     default=None,
-    help="Limit the number of speeches to download per day",
+    help=(
+        "Limit the total number of speeches to download (with several "
+        "--workers, which speeches fill the limit may vary; use --workers 1 "
+        "for strictly chronological downloads)"
+    ),
+)
+@click.option(
+    "--workers",
+    "-w",
+    type=click.IntRange(min=1),
+    default=DEFAULT_SCRAPE_WORKERS,
+    show_default=True,
+    help="Number of dates scraped concurrently",
+)
+@click.option(
+    "--request-interval",
+    type=click.FloatRange(min=0),
+    default=DEFAULT_REQUEST_INTERVAL,
+    show_default=True,
+    help="Minimum number of seconds between HTTP requests to the BIS website",
 )
 @click.pass_context
 def scrape(
@@ -125,31 +324,25 @@ def scrape(
     institutions: Tuple[str, ...],
     force: bool,
     limit: Optional[int],
+    workers: int,
+    request_interval: float,
 ) -> None:
     """Scrape speeches from the BIS website."""
-    from bis_scraper.scrapers.controller import scrape_bis
-
-    data_dir = ctx.obj["data_dir"]
-    log_dir = ctx.obj["log_dir"]
-
-    click.echo("Starting BIS web scraping...")
-    click.echo(f"Data directory: {data_dir.absolute()}")
-    click.echo(f"Date range: {start_date.date()} to {end_date.date()}")
-    scrape_bis(
-        data_dir=data_dir,
-        log_dir=log_dir,
-        start_date=start_date,
-        end_date=end_date,
-        institutions=institutions if institutions else None,
-        force=force,
-        limit=limit,
+    _run_scrape(
+        ctx, start_date, end_date, institutions, force, limit, workers, request_interval
     )
-    click.echo("Scraping completed!")
 
 
 @main.command()
+@click.option(
+    "--request-interval",
+    type=click.FloatRange(min=0),
+    default=DEFAULT_REQUEST_INTERVAL,
+    show_default=True,
+    help="Minimum number of seconds between HTTP requests to the BIS website",
+)
 @click.pass_context
-def recategorize(ctx: click.Context) -> None:
+def recategorize(ctx: click.Context, request_interval: float) -> None:
     """Re-categorize files from unknown folder using updated institution mappings.
 
     This command moves files from the unknown folder to their correct institution
@@ -159,24 +352,7 @@ def recategorize(ctx: click.Context) -> None:
     The command processes both PDFs and text files, moving them together to
     maintain consistency.
     """
-    from bis_scraper.scrapers.recategorize import recategorize_unknown_files
-
-    data_dir = ctx.obj["data_dir"]
-
-    click.echo("Re-categorizing files from unknown folder...")
-    click.echo(f"Data directory: {data_dir.absolute()}")
-
-    recategorized_count, remaining_unknown = recategorize_unknown_files(data_dir)
-
-    if recategorized_count > 0:
-        click.echo(f"Re-categorized {recategorized_count} file(s) from unknown folder")
-    else:
-        click.echo("No files found to re-categorize")
-
-    if remaining_unknown > 0:
-        click.echo(f"{remaining_unknown} file(s) still remain in unknown folder")
-
-    click.echo("Re-categorization completed!")
+    _run_recategorize(ctx, request_interval)
 
 
 @main.command()
@@ -208,6 +384,20 @@ def recategorize(ctx: click.Context) -> None:
     default=None,
     help="Limit the number of files to convert per institution",
 )
+@click.option(
+    "--workers",
+    "-w",
+    type=click.IntRange(min=1),
+    default=None,
+    help="Number of parallel conversion processes (default: number of CPU cores)",
+)
+@click.option(
+    "--backend",
+    type=click.Choice(PDF_BACKENDS),
+    default=DEFAULT_PDF_BACKEND,
+    show_default=True,
+    help="Text extraction backend used for PDF conversion",
+)
 @click.pass_context
 def convert(
     ctx: click.Context,
@@ -216,26 +406,13 @@ def convert(
     institutions: Tuple[str, ...],
     force: bool,
     limit: Optional[int],
+    workers: Optional[int],
+    backend: str,
 ) -> None:
     """Convert PDF speeches to text format."""
-    # Import inside function to avoid CLI import-time side effects
-    from bis_scraper.converters.controller import convert_pdfs_dates
-
-    data_dir = ctx.obj["data_dir"]
-    log_dir = ctx.obj["log_dir"]
-
-    click.echo("Starting PDF to text conversion...")
-    click.echo(f"Data directory: {data_dir.absolute()}")
-    convert_pdfs_dates(
-        data_dir=data_dir,
-        log_dir=log_dir,
-        start_date=start_date,
-        end_date=end_date,
-        institutions=institutions if institutions else None,
-        force=force,
-        limit=limit,
+    _run_convert(
+        ctx, start_date, end_date, institutions, force, limit, workers, backend
     )
-    click.echo("Conversion completed!")
 
 
 @main.command()
@@ -267,63 +444,120 @@ def convert(
     default=None,
     help="Limit the number of speeches/files to process",
 )
+@click.option(
+    "--workers",
+    "-w",
+    type=click.IntRange(min=1),
+    default=None,
+    help="Number of parallel conversion processes (default: number of CPU cores)",
+)
+@click.option(
+    "--backend",
+    type=click.Choice(PDF_BACKENDS),
+    default=DEFAULT_PDF_BACKEND,
+    show_default=True,
+    help="Text extraction backend used for PDF conversion",
+)
+@click.option(
+    "--scrape-workers",
+    type=click.IntRange(min=1),
+    default=DEFAULT_SCRAPE_WORKERS,
+    show_default=True,
+    help="Number of dates scraped concurrently",
+)
+@click.option(
+    "--request-interval",
+    type=click.FloatRange(min=0),
+    default=DEFAULT_REQUEST_INTERVAL,
+    show_default=True,
+    help="Minimum number of seconds between HTTP requests to the BIS website",
+)
 @click.pass_context
 def run_all(
     ctx: click.Context,
     start_date: Optional[datetime.datetime],
     end_date: Optional[datetime.datetime],
-    institutions: tuple[str, ...],
+    institutions: Tuple[str, ...],
     force: bool,
     limit: Optional[int],
+    workers: Optional[int],
+    backend: str,
+    scrape_workers: int,
+    request_interval: float,
 ) -> None:
-    """Run scraping, recategorization, and conversion steps."""
-    ctx.invoke(
-        scrape,
-        start_date=start_date,
-        end_date=end_date,
-        institutions=institutions,
-        force=force,
-        limit=limit,
+    """Run scraping, recategorization, and conversion steps.
+
+    Without --start-date/--end-date, scraping uses the same default range as
+    the scrape command and all downloaded PDFs are converted.
+    """
+    # Call the step implementations directly rather than re-dispatching the
+    # commands through Click
+    _run_scrape(
+        ctx,
+        start_date or _default_scrape_start_date(),
+        end_date or _default_scrape_end_date(),
+        institutions,
+        force,
+        limit,
+        scrape_workers,
+        request_interval,
     )
     # Re-categorize files from unknown folder
-    ctx.invoke(recategorize)
-    # Call convert with the same date range
-    ctx.invoke(
-        convert,
-        start_date=start_date,
-        end_date=end_date,
-        institutions=institutions,
-        force=force,
-        limit=limit,
+    _run_recategorize(ctx, request_interval)
+    # Convert with the same date range
+    _run_convert(
+        ctx, start_date, end_date, institutions, force, limit, workers, backend
     )
 
 
+def _load_cached_dates(
+    cache_file: pathlib.Path, journal_file: pathlib.Path
+) -> Dict[str, Dict[str, Any]]:
+    """Load the checked dates from the date cache and its journal.
+
+    Args:
+        cache_file: Path to the date cache snapshot
+        journal_file: Path to the date cache journal
+
+    Returns:
+        Cache entries keyed by date cache key
+    """
+    from bis_scraper.scrapers.bis_scraper import read_date_cache_journal
+    from bis_scraper.utils.json_utils import load_json_file
+
+    dates: Dict[str, Dict[str, Any]] = {}
+    if cache_file.exists():
+        dates.update(load_json_file(cache_file).get("dates", {}))
+    if journal_file.exists():
+        dates.update(read_date_cache_journal(journal_file))
+    return dates
+
+
 @main.command()
 @click.pass_context
 def clear_cache(ctx: click.Context) -> None:
     """Clear the date cache to force re-checking of all dates."""
     data_dir = ctx.obj["data_dir"]
-    cache_file = data_dir / RAW_DATA_DIR / ".bis_scraper_date_cache.json"
+    cache_file = data_dir / RAW_DATA_DIR / DATE_CACHE_NAME
+    journal_file = data_dir / RAW_DATA_DIR / DATE_CACHE_JOURNAL_NAME
 
-    if cache_file.exists():
+    if cache_file.exists() or journal_file.exists():
         try:
             # Read cache to show info
-            import json
-
-            with open(cache_file, "r", encoding="utf-8") as f:
-                cache_data = json.load(f)
-                num_dates = len(cache_data.get("dates", {}))
+            num_dates = len(_load_cached_dates(cache_file, journal_file))
 
             # Confirm with user
             if click.confirm(f"Clear date cache containing {num_dates} checked dates?"):
-                cache_file.unlink()
+                cache_file.unlink(missing_ok=True)
+                journal_file.unlink(missing_ok=True)
                 click.echo(f"✅ Date cache cleared ({num_dates} dates removed)")
             else:
                 click.echo("❌ Cache clearing cancelled")
         except Exception as e:
             click.echo(f"Error reading cache file: {e}", err=True)
             if click.confirm("Delete the cache file anyway?"):
-                cache_file.unlink()
+                cache_file.unlink(missing_ok=True)
+                journal_file.unlink(missing_ok=True)
                 click.echo("✅ Cache file deleted")
     else:
         click.echo("No date cache found. Nothing to clear.")
@@ -334,19 +568,19 @@ def clear_cache(ctx: click.Context) -> None:
 def show_cache_info(ctx: click.Context) -> None:
     """Show information about the date cache."""
     data_dir = ctx.obj["data_dir"]
-    cache_file = data_dir / RAW_DATA_DIR / ".bis_scraper_date_cache.json"
+    cache_file = data_dir / RAW_DATA_DIR / DATE_CACHE_NAME
+    journal_file = data_dir / RAW_DATA_DIR / DATE_CACHE_JOURNAL_NAME
 
-    if not cache_file.exists():
+    if not cache_file.exists() and not journal_file.exists():
         click.echo("No date cache found.")
         return
 
     try:
-        import json
+        from bis_scraper.utils.json_utils import load_json_file
 
-        with open(cache_file, "r") as f:
-            cache_data = json.load(f)
+        cache_data = load_json_file(cache_file) if cache_file.exists() else {}
 
-        dates = cache_data.get("dates", {})
+        dates = _load_cached_dates(cache_file, journal_file)
         updated = cache_data.get("updated", "Unknown")
 
         click.echo("Date cache information:")
@@ -8,7 +8,7 @@ from typing import Optional, Tuple
 
 from bis_scraper.converters.pdf_converter import PdfConverter
 from bis_scraper.models import ConversionResult
-from bis_scraper.utils.constants import RAW_DATA_DIR, TXT_DATA_DIR
+from bis_scraper.utils.constants import DEFAULT_PDF_BACKEND, RAW_DATA_DIR, TXT_DATA_DIR
 from bis_scraper.utils.file_utils import list_directories
 from bis_scraper.utils.institution_utils import normalize_institution_name
 
@@ -21,6 +21,8 @@ def convert_pdfs(
     institutions: Optional[Tuple[str, ...]] = None,
     force: bool = False,
     limit: Optional[int] = None,
+    workers: Optional[int] = None,
+    backend: str = DEFAULT_PDF_BACKEND,
 ) -> ConversionResult:
     """Convert PDF speeches to text format.
 
@@ -30,6 +32,8 @@ def convert_pdfs(
         institutions: Specific institutions to convert (default: all)
         force: Whether to force re-convert existing files
         limit: Maximum number of files to convert per institution
+        workers: Number of worker processes (default: one per CPU core)
+        backend: Text extraction backend ("pdfium" or "textract")
 
     Returns:
         ConversionResult with statistics
@@ -42,6 +46,8 @@ def convert_pdfs(
         institutions=institutions,
         force=force,
         limit=limit,
+        workers=workers,
+        backend=backend,
     )
 
 
@@ -53,6 +59,8 @@ def convert_pdfs_dates(
     institutions: Optional[Tuple[str, ...]] = None,
     force: bool = False,
     limit: Optional[int] = None,
+    workers: Optional[int] = None,
+    backend: str = DEFAULT_PDF_BACKEND,
 ) -> ConversionResult:
     """Convert PDF speeches to text format with optional date filtering.
 
@@ -64,6 +72,8 @@ def convert_pdfs_dates(
         institutions: Specific institutions to convert (default: all)
         force: Whether to force re-convert existing files
         limit: Maximum number of files to convert per institution
+        workers: Number of worker processes (default: one per CPU core)
+        backend: Text extraction backend ("pdfium" or "textract")
 
     Returns:
         ConversionResult with statistics
@@ -100,6 +110,8 @@ def convert_pdfs_dates(
         institutions=normalized_institutions,
         force_convert=force,
         limit=limit,
+        workers=workers,
+        backend=backend,
     )
     # Apply optional date filters
     converter.start_date = start_date_obj
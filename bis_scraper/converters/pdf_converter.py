@@ -1,13 +1,17 @@
 """PDF to text converter implementation."""
 
 import datetime
+import itertools
 import logging
+import multiprocessing.util
+import os
+import traceback
+from concurrent.futures import ProcessPoolExecutor, as_completed
 from pathlib import Path
-from typing import List, Optional
-
-import textract  # type: ignore
+from typing import Generator, Iterable, Iterator, List, Optional, Tuple
 
 from bis_scraper.models import ConversionResult
+from bis_scraper.utils.constants import DEFAULT_PDF_BACKEND, PDF_BACKENDS
 from bis_scraper.utils.date_utils import parse_date_code
 from bis_scraper.utils.file_utils import create_directory
 from bis_scraper.utils.institution_utils import normalize_institution_name
@@ -27,6 +31,8 @@ class PdfConverter:
         limit: Optional[int] = None,
         start_date: Optional[datetime.date] = None,
         end_date: Optional[datetime.date] = None,
+        workers: Optional[int] = None,
+        backend: str = DEFAULT_PDF_BACKEND,
     ):
         """Initialize the PDF converter.
 
@@ -38,7 +44,15 @@ class PdfConverter:
             limit: Maximum number of files to convert per institution
             start_date: Convert only files with date >= this date
             end_date: Convert only files with date <= this date
+            workers: Number of worker processes (None = one per CPU core)
+            backend: Text extraction backend ("pdfium" or "textract")
+
+        Raises:
+            ValueError: If the backend is not supported
         """
+        if backend not in PDF_BACKENDS:
+            raise ValueError(f"Unsupported PDF backend: {backend}")
+
         self.input_dir = input_dir
         self.output_dir = output_dir
         # Normalize institution names if provided
@@ -47,11 +61,17 @@ class PdfConverter:
             if institutions
             else None
         )
+        # Set for constant-time membership checks in convert_institution
+        self._institution_set = (
+            frozenset(self.institutions) if self.institutions else None
+        )
         self.force_convert = force_convert
         self.limit = limit
         self.result = ConversionResult()
         self.start_date: Optional[datetime.date] = start_date
         self.end_date: Optional[datetime.date] = end_date
+        self.workers = workers if workers is not None else (os.cpu_count() or 1)
+        self.backend = backend
 
         # Create output directory
         create_directory(self.output_dir)
@@ -66,13 +86,12 @@ class PdfConverter:
         normalized_institution = normalize_institution_name(institution)
 
         # Skip if not in the list of required institutions
-        if self.institutions is not None:
-            allowed_institutions = set(self.institutions)
-            if normalized_institution not in allowed_institutions:
-                logger.debug(
-                    f"Skipping institution {institution} (not in required list)"
-                )
-                return
+        if (
+            self._institution_set is not None
+            and normalized_institution not in self._institution_set
+        ):
+            logger.debug(f"Skipping institution {institution} (not in required list)")
+            return
 
         # Check if institution directory exists in input
         inst_input_dir = self.input_dir / normalized_institution
@@ -84,104 +103,151 @@ class PdfConverter:
         inst_output_dir = self.output_dir / normalized_institution
         create_directory(inst_output_dir)
 
-        # Process all PDFs in the institution directory - using new filename format
-        pdf_files = list(inst_input_dir.glob("*.pdf"))
+        # Index already converted files once instead of stat-ing every text path
+        with os.scandir(inst_output_dir) as entries:
+            converted_mtimes = {
+                e.name[:-4]: e.stat().st_mtime
+                for e in entries
+                if e.name.endswith(".txt")
+            }
+
+        # Apply limit if specified
+        limit = self.limit if self.limit is not None and self.limit > 0 else None
+        if limit is not None:
+            logger.info(
+                f"Limiting conversion to {limit} files for {normalized_institution}"
+            )
+
+        successful = self.result.successful
+        failed = self.result.failed
+
+        # Scan, filter and classify the PDFs in a single pass
+        pending_files: List[Tuple[Path, int]] = []
+        skipped = 0
+        pdf_entries = self._iter_pdf_entries(inst_input_dir)
+        try:
+            for entry, error in itertools.islice(pdf_entries, limit):
+                file_code = entry.name[:-4]
+                # Skip if an up-to-date text file exists and we're not forcing conversion
+                txt_mtime = converted_mtimes.get(file_code)
+                pdf_stat = entry.stat()
+                if (
+                    not self.force_convert
+                    and txt_mtime is not None
+                    and txt_mtime >= pdf_stat.st_mtime
+                ):
+                    logger.debug(
+                        f"Skipping {file_code} (already converted to {file_code}.txt)"
+                    )
+                    skipped += 1
+                elif error is not None:
+                    self._record_result(file_code, "failed", error)
+                else:
+                    pending_files.append((Path(entry.path), pdf_stat.st_size))
+        finally:
+            pdf_entries.close()
+
+        self.result.skipped += skipped
+
+        # Convert sequentially when parallelism would not help, otherwise fan out
+        # the (independent, CPU-bound) conversions across a process pool
+        if self.workers <= 1 or len(pending_files) <= 1:
+            for pdf_file, _ in pending_files:
+                self._record_result(
+                    *_convert_pdf(pdf_file, inst_output_dir, self.backend)
+                )
+        else:
+            # Write out buffered log records so forked workers don't inherit
+            # (and later re-emit) them
+            _flush_log_handlers()
+            # Load the backend before forking so workers inherit it; workers
+            # started with "spawn" load it in the initializer instead
+            _load_backend(self.backend)
+            # Start the largest PDFs first so that a few big files don't end up
+            # running alone at the end while the other workers sit idle
+            pending_files.sort(key=lambda item: item[1], reverse=True)
+            max_workers = min(self.workers, len(pending_files))
+            with ProcessPoolExecutor(
+                max_workers=max_workers,
+                initializer=_init_worker,
+                initargs=(self.backend,),
+            ) as executor:
+                futures = [
+                    executor.submit(
+                        _convert_pdf, pdf_file, inst_output_dir, self.backend
+                    )
+                    for pdf_file, _ in pending_files
+                ]
+                for future in as_completed(futures):
+                    self._record_result(*future.result())
+
+        logger.info(
+            f"{normalized_institution}: converted {self.result.successful - successful}, "
+            f"skipped {skipped}, failed {self.result.failed - failed}"
+        )
+
+    def _iter_pdf_entries(
+        self, inst_input_dir: Path
+    ) -> Generator[Tuple["os.DirEntry[str]", Optional[str]], None, None]:
+        """Iterate over the PDFs of an institution that are within the date range.
 
-        # Optional date filtering based on filename date code
-        if self.start_date is not None or self.end_date is not None:
-            filtered_pdf_files = []
-            for pdf_file in pdf_files:
-                file_code = pdf_file.stem
+        The directory is scanned lazily with os.scandir, so no intermediate
+        lists are built and entries beyond the conversion limit are never
+        stat-ed.
+
+        Args:
+            inst_input_dir: Institution directory containing PDF files
+
+        Yields:
+            Tuples of (directory entry, error) where error describes an invalid
+            file name (only reported when not filtering by date)
+        """
+        filter_dates = self.start_date is not None or self.end_date is not None
+        with os.scandir(inst_input_dir) as entries:
+            for entry in entries:
+                if not entry.name.endswith(".pdf") or not entry.is_file():
+                    continue
                 try:
-                    date_obj, _ = parse_date_code(file_code)
-                except Exception:
-                    # Skip files with unexpected naming
+                    date_obj, _ = parse_date_code(entry.name[:-4])
+                except ValueError as e:
+                    # Files with unexpected naming fail conversion, unless
+                    # filtering by date, in which case they are left out
+                    if not filter_dates:
+                        yield entry, str(e)
                     continue
                 if self.start_date is not None and date_obj < self.start_date:
                     continue
                 if self.end_date is not None and date_obj > self.end_date:
                     continue
-                filtered_pdf_files.append(pdf_file)
-            pdf_files = filtered_pdf_files
-
-        # Apply limit if specified
-        if self.limit is not None and self.limit > 0:
-            logger.info(
-                f"Limiting conversion to {self.limit} files for {normalized_institution}"
-            )
-            pdf_files = pdf_files[: self.limit]
+                yield entry, None
 
-        for pdf_file in pdf_files:
-            # Process each file, catching exceptions to allow processing to continue
-            try:
-                self._convert_pdf(pdf_file, inst_output_dir)
-            except Exception as e:
-                # Log error and continue with the next file
-                file_code = pdf_file.stem
-                logger.error(f"Error converting {file_code}: {str(e)}", exc_info=True)
-                self.result.failed += 1
-                self.result.errors[file_code] = str(e)
-
-    def _convert_pdf(self, pdf_path: Path, output_dir: Path) -> None:
-        """Convert a single PDF file to text.
+    def _record_result(
+        self,
+        file_code: str,
+        status: str,
+        error: Optional[str],
+        error_traceback: Optional[str] = None,
+    ) -> None:
+        """Merge the outcome of a single file conversion into the results.
 
         Args:
-            pdf_path: Path to PDF file
-            output_dir: Directory to save text file
+            file_code: File code of the converted PDF (e.g., "220101a")
+            status: Either "successful" or "failed"
+            error: Error message for failed conversions
+            error_traceback: Formatted traceback of the conversion error, if any
         """
-        # Extract file code (e.g., "220101a") from filename (now just the stem without extension)
-        file_code = pdf_path.stem
-
-        try:
-            # Validate filename by parsing date code
-            parse_date_code(file_code)
-
-            # Create output filename matching the input filename but with .txt extension
-            txt_filename = f"{file_code}.txt"
-            txt_path = output_dir / txt_filename
-
-            # Skip if the text file already exists and we're not forcing conversion
-            if txt_path.exists() and not self.force_convert:
-                # Print a message for CLI feedback
-                skip_message = (
-                    f"Skipping {file_code} (already converted to {txt_filename})"
-                )
-                logger.debug(skip_message)
-                print(skip_message)  # Print to stdout for CLI feedback
-                self.result.skipped += 1
-                return
-
-            # Extract text from PDF
-            logger.debug(f"Converting {pdf_path}")
-            text = textract.process(str(pdf_path))
-
-            # Handle different return types from textract
-            if text is None:
-                raise ValueError(f"textract returned None for {pdf_path}")
-            elif isinstance(text, bytes):
-                text_str = text.decode("utf-8")
-            else:
-                # textract may return a string directly
-                text_str = str(text)
-
-            # Save text to file
-            with open(txt_path, "w", encoding="utf-8") as f:
-                f.write(text_str)
-
-            # Print conversion message for CLI feedback
-            conversion_message = f"Converted {file_code} to {txt_filename}"
-            logger.info(conversion_message)
-            print(conversion_message)  # Print to stdout for CLI feedback
+        if status == "successful":
+            logger.info(f"Converted {file_code} to {file_code}.txt")
             self.result.successful += 1
-
-        except Exception as e:
-            error_message = f"Error converting {file_code}: {str(e)}"
-            logger.error(error_message, exc_info=True)
-            print(f"Error: {error_message}")  # Print to stdout for CLI feedback
+        else:
+            message = f"Error converting {file_code}: {error}"
+            if error_traceback:
+                # The traceback was formatted in the (possibly separate) worker
+                # process, so it is logged as part of the message
+                message = f"{message}\n{error_traceback.rstrip()}"
+            logger.error(message)
             self.result.failed += 1
-            self.result.errors[file_code] = str(e)
-            # Don't re-raise - let convert_institution handle continuation
-            return
+            self.result.errors[file_code] = error or "Unknown error"
 
     def get_results(self) -> ConversionResult:
         """Get the conversion results.
@@ -190,3 +256,176 @@ class PdfConverter:
             ConversionResult object with statistics
         """
         return self.result
+
+
+def _convert_pdf(
+    pdf_path: Path, output_dir: Path, backend: str
+) -> Tuple[str, str, Optional[str], Optional[str]]:
+    """Convert a single PDF file to text.
+
+    This is a module-level function so that it can be pickled and run in a
+    worker process. It does not touch any shared state; the caller merges (and
+    reports) the returned outcome into its ConversionResult.
+
+    Args:
+        pdf_path: Path to PDF file
+        output_dir: Directory to save text file
+        backend: Text extraction backend ("pdfium" or "textract")
+
+    Returns:
+        Tuple of (file_code, status, error, error_traceback) where status is
+        either "successful" or "failed"
+    """
+    # Extract file code (e.g., "220101a") from filename (now just the stem without extension)
+    file_code = pdf_path.stem
+
+    try:
+        # Create output filename matching the input filename but with .txt extension
+        txt_filename = f"{file_code}.txt"
+        txt_path = output_dir / txt_filename
+
+        # Extract text from PDF and save it to file. pdfium output is streamed
+        # page by page, so the whole document's text is never held in memory.
+        logger.debug(f"Converting {pdf_path} using {backend}")
+        if backend == "textract":
+            _write_text_file(txt_path, [_extract_text_textract(pdf_path)])
+        else:
+            try:
+                _write_text_file(txt_path, _iter_text_pdfium(pdf_path))
+            except Exception as pdfium_error:
+                # pdfium rejects some PDFs (e.g. encrypted or malformed ones)
+                # that textract may still be able to read
+                logger.debug(
+                    f"pdfium failed for {file_code} ({pdfium_error}), "
+                    "falling back to textract"
+                )
+                try:
+                    _write_text_file(txt_path, [_extract_text_textract(pdf_path)])
+                except Exception:
+                    logger.debug(
+                        f"textract fallback failed for {file_code}", exc_info=True
+                    )
+                    raise pdfium_error from None
+
+        return file_code, "successful", None, None
+
+    except Exception as e:
+        return file_code, "failed", str(e), traceback.format_exc()
+
+
+def _write_text_file(path: Path, chunks: Iterable[bytes]) -> None:
+    """Write already encoded text to a file with raw writes.
+
+    This bypasses the TextIOWrapper and BufferedWriter layers of open(). The
+    text is written to a temporary file next to the target, which replaces
+    the target only once all chunks were written; if producing the chunks
+    fails, an existing text file (e.g. from an earlier conversion) is kept.
+
+    Args:
+        path: Path of the file to write
+        chunks: UTF-8 encoded pieces of text, written in order
+    """
+    tmp_path = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+    fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        try:
+            for chunk in chunks:
+                data = memoryview(chunk)
+                # os.write may write fewer bytes than requested for large buffers
+                while data:
+                    data = data[os.write(fd, data) :]
+        finally:
+            os.close(fd)
+        os.replace(tmp_path, path)
+    except BaseException:
+        tmp_path.unlink(missing_ok=True)
+        raise
+
+
+def _load_backend(backend: str) -> None:
+    """Import the module of a text extraction backend ahead of its first use.
+
+    Args:
+        backend: Text extraction backend ("pdfium" or "textract")
+    """
+    if backend == "textract":
+        import textract  # type: ignore # noqa: F401
+    else:
+        import pypdfium2  # type: ignore # noqa: F401
+
+
+def _init_worker(backend: str) -> None:
+    """Set up a conversion worker process.
+
+    Loads the extraction backend up front so that the first conversion in
+    the worker doesn't pay for the import. Worker processes exit without
+    running atexit handlers, so buffered log records are flushed through a
+    multiprocessing finalizer instead.
+
+    Args:
+        backend: Text extraction backend ("pdfium" or "textract")
+    """
+    _load_backend(backend)
+    multiprocessing.util.Finalize(None, _flush_log_handlers, exitpriority=0)
+
+
+def _flush_log_handlers() -> None:
+    """Flush all handlers attached to the root logger."""
+    for handler in logging.getLogger().handlers:
+        handler.flush()
+
+
+def _iter_text_pdfium(pdf_path: Path) -> Iterator[bytes]:
+    """Extract text from a PDF in-process using pdfium, one page at a time.
+
+    Args:
+        pdf_path: Path to PDF file
+
+    Yields:
+        UTF-8 encoded text of each page, with newlines between pages
+    """
+    # Imported lazily so that the backend is only loaded when it is used
+    import pypdfium2 as pdfium  # type: ignore
+
+    pdf = pdfium.PdfDocument(str(pdf_path))
+    try:
+        for index, page in enumerate(pdf):
+            textpage = page.get_textpage()
+            try:
+                text = textpage.get_text_range()
+            finally:
+                textpage.close()
+                page.close()
+            if index:
+                yield b"\n"
+            yield text.encode("utf-8")
+    finally:
+        pdf.close()
+
+
+def _extract_text_textract(pdf_path: Path) -> bytes:
+    """Extract text from a PDF using textract.
+
+    Args:
+        pdf_path: Path to PDF file
+
+    Returns:
+        Extracted text, UTF-8 encoded
+
+    Raises:
+        ValueError: If textract returns no output
+    """
+    # Imported lazily so that the backend is only loaded when it is used
+    import textract  # type: ignore
+
+    text = textract.process(str(pdf_path))
+
+    # Handle different return types from textract
+    if text is None:
+        raise ValueError(f"textract returned None for {pdf_path}")
+    elif isinstance(text, bytes):
+        # textract already returns UTF-8, so the bytes are written as they are
+        return text
+    else:
+        # textract may return a string directly
+        return str(text).encode("utf-8")
@@ -1,33 +1,71 @@
 """BIS website scraper for central bank speeches."""
 
 import datetime
-import json
 import logging
-import time
+import os
+import shutil
+import string
+import threading
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Set
+from typing import Any, Dict, FrozenSet, List, Optional, Set
 
 import requests
-from bs4 import BeautifulSoup
 
 from bis_scraper.models import ScrapingResult
+from bis_scraper.utils.async_writer import AsyncMetadataWriter
 from bis_scraper.utils.constants import (
+    DATE_CACHE_JOURNAL_NAME,
+    DATE_CACHE_NAME,
+    DEFAULT_REQUEST_INTERVAL,
+    DOWNLOAD_CHUNK_SIZE,
     HTML_EXTENSION,
     PDF_EXTENSION,
     SPEECHES_URL,
 )
 from bis_scraper.utils.file_utils import (
+    build_metadata_entry,
     create_directory,
+    find_existing_files,
     format_filename,
     get_institution_directory,
-    save_metadata_to_json,
+    list_directories,
 )
+from bis_scraper.utils.html_utils import extract_metadata_text
+from bis_scraper.utils.http_utils import RateLimiter, create_session
 from bis_scraper.utils.institution_utils import (
     get_institution_from_metadata,
 )
+from bis_scraper.utils.json_utils import (
+    append_json_lines,
+    dump_json_file,
+    load_json_file,
+    load_json_lines,
+)
 
 logger = logging.getLogger(__name__)
 
+# Letters appended to the date to form speech codes (r200101a, r200101b, ...)
+_SPEECH_LETTERS = string.ascii_lowercase
+
+
+def read_date_cache_journal(journal_file: Path) -> Dict[str, Dict[str, Any]]:
+    """Read the date cache entries appended to a date cache journal.
+
+    Args:
+        journal_file: Path to the journal
+
+    Returns:
+        Cache entries keyed by date cache key (later lines win)
+
+    Raises:
+        OSError: If the journal cannot be read
+    """
+    return {
+        record["key"]: record.get("entry", {})
+        for record in load_json_lines(journal_file)
+        if isinstance(record, dict) and "key" in record
+    }
+
 
 class BisScraper:
     """Scraper for the BIS central bank speeches website."""
@@ -38,6 +76,7 @@ class BisScraper:
         institutions: Optional[List[str]] = None,
         force_download: bool = False,
         limit: Optional[int] = None,
+        request_interval: float = DEFAULT_REQUEST_INTERVAL,
     ):
         """Initialize the BIS scraper.
 
@@ -46,23 +85,48 @@ class BisScraper:
             institutions: List of institutions to scrape (None = all)
             force_download: Force re-download of existing files
             limit: Maximum number of speeches to download
+            request_interval: Minimum number of seconds between the start of
+                two requests to the BIS website (shared by all threads)
         """
         self.output_dir = output_dir
         self.institutions = institutions
+        # Lowercased institution filter for constant-time membership checks
+        self._institution_filter: Optional[FrozenSet[str]] = (
+            frozenset(i.lower() for i in institutions)
+            if institutions is not None
+            else None
+        )
         self.force_download = force_download
         self.limit = limit  # Used directly in this class to limit downloads
         self.result = ScrapingResult()
 
+        # Dates may be scraped from several threads at once; this lock guards
+        # the result counters, the in-memory caches and the date cache file
+        self._lock = threading.Lock()
+        # Downloads that have claimed a slot under the limit but not finished yet
+        self._downloads_in_progress = 0
+
+        # Shared HTTP session so connections are reused across requests
+        self.session = create_session()
+        # Keeps the request rate polite however many dates run concurrently
+        self._rate_limiter = RateLimiter(request_interval)
+
+        # metadata.json files are written by a single background thread
+        self._metadata_writer = AsyncMetadataWriter()
+
         # Ensure output directory exists
         create_directory(self.output_dir)
 
-        # Date cache file path
-        self.date_cache_file = self.output_dir / ".bis_scraper_date_cache.json"
+        # Date cache file paths
+        self.date_cache_file = self.output_dir / DATE_CACHE_NAME
+        self.date_cache_journal_file = self.output_dir / DATE_CACHE_JOURNAL_NAME
 
         # Build cache of existing files (filename without the 'r' prefix)
         self.existing_files: Set[str] = set()
         # Build cache of fully checked dates
         self.checked_dates: Dict[str, Dict[str, Any]] = {}
+        # Checked dates not yet appended to the date cache journal
+        self._unsaved_dates: Dict[str, Dict[str, Any]] = {}
 
         if not force_download:
             self._build_existing_files_cache()
@@ -75,46 +139,140 @@ class BisScraper:
     def _build_existing_files_cache(self) -> None:
         """Build cache of existing files to avoid filesystem checks."""
         # Find all institution directories
-        for inst_dir in self.output_dir.iterdir():
-            if inst_dir.is_dir() and not inst_dir.name.startswith("."):
-                # Find all PDF files in this institution directory
-                for file_path in inst_dir.glob("*.pdf"):
-                    # Extract the code part without the 'r' prefix
-                    code = file_path.stem
-                    self.existing_files.add(code)
+        for inst_name in list_directories(self.output_dir):
+            if not inst_name.startswith("."):
+                # Find all PDF files (codes without the 'r' prefix) in this directory
+                self.existing_files.update(
+                    find_existing_files(self.output_dir / inst_name, PDF_EXTENSION)
+                )
 
     def _load_date_cache(self) -> None:
         """Load the date cache from disk."""
         if self.date_cache_file.exists():
             try:
-                with open(self.date_cache_file, "r", encoding="utf-8") as f:
-                    cache_data = json.load(f)
-                    # Convert cache format if needed (for backwards compatibility)
-                    if isinstance(cache_data, dict) and "version" in cache_data:
-                        self.checked_dates = cache_data.get("dates", {})
-                    else:
-                        # Old format or corrupted, start fresh
-                        self.checked_dates = {}
-                        logger.warning("Date cache format unrecognized, starting fresh")
+                cache_data = load_json_file(self.date_cache_file)
+                # Convert cache format if needed (for backwards compatibility)
+                if isinstance(cache_data, dict) and "version" in cache_data:
+                    self.checked_dates = cache_data.get("dates", {})
+                else:
+                    # Old format or corrupted, start fresh
+                    self.checked_dates = {}
+                    logger.warning("Date cache format unrecognized, starting fresh")
             except Exception as e:
                 logger.warning(f"Could not load date cache: {e}, starting fresh")
                 self.checked_dates = {}
         else:
             self.checked_dates = {}
 
+        # Dates checked by an earlier run that ended before writing the snapshot
+        if self.date_cache_journal_file.exists():
+            try:
+                self.checked_dates.update(
+                    read_date_cache_journal(self.date_cache_journal_file)
+                )
+            except OSError as e:
+                logger.warning(f"Could not load date cache journal: {e}")
+
+    def _append_date_cache(self) -> None:
+        """Append the dates checked since the last save to the date cache journal.
+
+        Unlike _save_date_cache(), this only writes the new dates, so saving
+        regularly during a long run does not rewrite the whole cache each time.
+        """
+        # Metadata must be on disk before the dates that produced it are cached
+        self._metadata_writer.flush()
+
+        with self._lock:
+            if not self._unsaved_dates:
+                return
+            try:
+                append_json_lines(
+                    self.date_cache_journal_file,
+                    (
+                        {"key": key, "entry": entry}
+                        for key, entry in self._unsaved_dates.items()
+                    ),
+                )
+                logger.debug(
+                    f"Appended {len(self._unsaved_dates)} dates to the date cache journal"
+                )
+                self._unsaved_dates.clear()
+            except Exception as e:
+                logger.error(f"Could not save date cache: {e}")
+
     def _save_date_cache(self) -> None:
-        """Save the date cache to disk."""
-        try:
-            cache_data = {
-                "version": 1,
-                "dates": self.checked_dates,
-                "updated": datetime.datetime.now().isoformat(),
-            }
-            with open(self.date_cache_file, "w", encoding="utf-8") as f:
-                json.dump(cache_data, f, indent=2)
-            logger.debug(f"Saved date cache with {len(self.checked_dates)} dates")
-        except Exception as e:
-            logger.error(f"Could not save date cache: {e}")
+        """Save the whole date cache to disk and empty the journal."""
+        # Metadata must be on disk before the dates that produced it are cached
+        self._metadata_writer.flush()
+
+        with self._lock:
+            try:
+                cache_data = {
+                    "version": 1,
+                    "dates": self.checked_dates,
+                    "updated": datetime.datetime.now().isoformat(),
+                }
+                dump_json_file(self.date_cache_file, cache_data)
+                # Everything in the journal is now part of the snapshot
+                self.date_cache_journal_file.unlink(missing_ok=True)
+                self._unsaved_dates.clear()
+                logger.debug(f"Saved date cache with {len(self.checked_dates)} dates")
+            except Exception as e:
+                logger.error(f"Could not save date cache: {e}")
+
+    def _add_counts(self, skipped: int = 0, failed: int = 0) -> None:
+        """Add to the skipped and failed counters of the result.
+
+        Args:
+            skipped: Number of skipped speeches to add
+            failed: Number of failed speeches to add
+        """
+        with self._lock:
+            self.result.skipped += skipped
+            self.result.failed += failed
+
+    def _reserve_download(self) -> bool:
+        """Claim a download slot under the download limit.
+
+        Returns:
+            bool: True if the download may go ahead, False if the limit is reached
+        """
+        with self._lock:
+            if (
+                self.limit is not None
+                and self.result.downloaded + self._downloads_in_progress >= self.limit
+            ):
+                return False
+            self._downloads_in_progress += 1
+            return True
+
+    def _release_download(self, downloaded: bool) -> bool:
+        """Release a download slot claimed with _reserve_download.
+
+        Args:
+            downloaded: Whether the download succeeded
+
+        Returns:
+            bool: True if the download limit has now been reached
+        """
+        with self._lock:
+            self._downloads_in_progress -= 1
+            if downloaded:
+                self.result.downloaded += 1
+            return self.limit is not None and self.result.downloaded >= self.limit
+
+    def _get(self, url: str, stream: bool = False) -> requests.Response:
+        """Send a rate-limited GET request using the shared session.
+
+        Args:
+            url: URL to request
+            stream: Whether to stream the response body
+
+        Returns:
+            HTTP response
+        """
+        self._rate_limiter.wait()
+        return self.session.get(url, stream=stream, timeout=30)
 
     def _get_date_cache_key(self, date_obj: datetime.date) -> str:
         """Get the cache key for a date, considering institution filtering."""
@@ -141,43 +299,60 @@ class BisScraper:
             # Skip this date entirely - it's been fully checked
             logger.debug(f"Skipping {date_obj.isoformat()} (found in date cache)")
             # Update result counts from cache
-            self.result.skipped += cache_entry.get("files_found", 0)
+            self._add_counts(skipped=cache_entry.get("files_found", 0))
+            return True
+
+        # A date without any speeches is empty whatever the institution filter,
+        # so an empty result from an earlier (differently filtered) run is reused
+        date_key = date_obj.isoformat()
+        if not self.force_download and self.checked_dates.get(date_key, {}).get(
+            "empty", False
+        ):
+            logger.debug(f"Skipping {date_key} (no speeches according to date cache)")
             return True
 
         # Track if we found any speeches for this date
         date_had_speeches = False
+        date_is_empty = False  # Set when the first letter returns 404
         files_found_count = 0
         had_network_error = False  # Track if we had network errors
 
         # Format date for URL: YYMMDD (without century)
-        date_str = date_obj.strftime("%y%m%d")
+        date_str = "%02d%02d%02d" % (date_obj.year % 100, date_obj.month, date_obj.day)
 
-        # Try all possible letters for this date
-        for letter_code in "abcdefghijklmnopqrstuvwxyz":
-            # Create the code without the 'r' prefix for cache checking
-            code_without_r = f"{date_str}{letter_code}"
-            speech_code = f"r{code_without_r}"
+        # Codes without the 'r' prefix for every possible letter on this date
+        codes = [f"{date_str}{letter_code}" for letter_code in _SPEECH_LETTERS]
 
-            # Quick check for cached file before making network request
-            if not self.force_download and code_without_r in self.existing_files:
-                # Skip the network request entirely if we already have this file
-                logger.debug(f"Skipping {speech_code} (found in cache)")
-                self.result.skipped += 1
+        # Skip the network request entirely for files we already have
+        if self.force_download:
+            codes_to_fetch = codes
+        else:
+            codes_to_fetch = [c for c in codes if c not in self.existing_files]
+            cached_count = len(codes) - len(codes_to_fetch)
+            if cached_count:
+                logger.debug(
+                    f"Skipping {cached_count} speeches for {date_obj.isoformat()} "
+                    f"(found in cache)"
+                )
+                self._add_counts(skipped=cached_count)
                 date_had_speeches = True
-                files_found_count += 1
-                continue
+                files_found_count = cached_count
 
+        # Try the remaining letters for this date
+        for code_without_r in codes_to_fetch:
+            speech_code = f"r{code_without_r}"
             url = f"{SPEECHES_URL}/{speech_code}{HTML_EXTENSION}"
 
             try:
                 # Request the page
-                response = requests.get(url, timeout=30)
+                response = self._get(url)
                 if response.status_code == 404:
                     # If first letter returns 404, likely no speeches for this date
-                    if letter_code == "a":
-                        message = f"No speeches found for {date_obj.isoformat()} (404 Not Found at {url})"
-                        logger.info(message)
-                        print(message)  # Print to stdout for CLI feedback
+                    if code_without_r == codes[0]:
+                        date_is_empty = True
+                        logger.info(
+                            f"No speeches found for {date_obj.isoformat()} (404 Not Found at {url})"
+                        )
                     # Stop trying more letters if we hit a 404
                     break
 
@@ -190,7 +365,7 @@ class BisScraper:
                 # Process the speech
                 pdf_url = f"{SPEECHES_URL}/{speech_code}{PDF_EXTENSION}"
                 should_continue = self._process_speech_from_code(
-                    speech_code, pdf_url, date_obj
+                    speech_code, pdf_url, date_obj, metadata_html=response.text
                 )
                 if should_continue:
                     files_found_count += 1
@@ -206,32 +381,46 @@ class BisScraper:
                         f"Error scraping {date_obj.isoformat()} - {speech_code}: {str(e)}",
                         exc_info=True,
                     )
-                    self.result.failed += 1
+                    self._add_counts(failed=1)
                 elif "response" not in locals():
                     # Network error before response was created
                     logger.error(
                         f"Network error scraping {date_obj.isoformat()} - {speech_code}: {str(e)}",
                         exc_info=True,
                     )
-                    self.result.failed += 1
+                    self._add_counts(failed=1)
                     had_network_error = True
 
         # Only mark date as checked if we didn't have network errors
         # Network errors mean we couldn't fully check the date, so we shouldn't cache it
-        if not had_network_error:
-            self.checked_dates[cache_key] = {
-                "checked_at": datetime.datetime.now().isoformat(),
-                "had_speeches": date_had_speeches,
-                "files_found": files_found_count,
-            }
-        # Save cache periodically (every 10 dates to balance performance and safety)
-        if len(self.checked_dates) % 10 == 0:
-            self._save_date_cache()
+        with self._lock:
+            if not had_network_error:
+                cache_entry = {
+                    "checked_at": datetime.datetime.now().isoformat(),
+                    "had_speeches": date_had_speeches,
+                    "files_found": files_found_count,
+                }
+                if date_is_empty and not date_had_speeches:
+                    cache_entry["empty"] = True
+                    # Also record it under the unfiltered key for other filters
+                    if date_key not in self.checked_dates:
+                        self.checked_dates[date_key] = dict(cache_entry)
+                        self._unsaved_dates[date_key] = self.checked_dates[date_key]
+                self.checked_dates[cache_key] = cache_entry
+                self._unsaved_dates[cache_key] = cache_entry
+            # Save cache periodically (every 10 dates to balance performance and safety)
+            save_cache = len(self._unsaved_dates) >= 10
+        if save_cache:
+            self._append_date_cache()
 
         return True
 
     def _process_speech_from_code(
-        self, speech_code: str, pdf_url: str, date_obj: datetime.date
+        self,
+        speech_code: str,
+        pdf_url: str,
+        date_obj: datetime.date,
+        metadata_html: Optional[str] = None,
     ) -> bool:
         """Process a speech using its code.
 
@@ -239,28 +428,21 @@ class BisScraper:
             speech_code: Speech code (e.g., r200108a)
             pdf_url: URL to the PDF file
             date_obj: Date of the speech
+            metadata_html: Already downloaded metadata page (fetched if None)
 
         Returns:
             bool: True if processing should continue, False if limit reached
         """
         try:
-            # Get metadata page URL
-            metadata_url = f"{SPEECHES_URL}/{speech_code}{HTML_EXTENSION}"
-
-            # Get the metadata page
-            metadata_response = requests.get(metadata_url, timeout=30)
-            metadata_response.raise_for_status()
-
-            # Parse metadata page
-            metadata_soup = BeautifulSoup(metadata_response.text, "html.parser")
+            # Get the metadata page, unless the caller already downloaded it
+            if metadata_html is None:
+                metadata_url = f"{SPEECHES_URL}/{speech_code}{HTML_EXTENSION}"
+                metadata_response = self._get(metadata_url)
+                metadata_response.raise_for_status()
+                metadata_html = metadata_response.text
 
             # Extract metadata - specifically look for extratitle-div like in the original code
-            extratitle_div = metadata_soup.find(id="extratitle-div")
-            if extratitle_div:
-                metadata_text = extratitle_div.text.strip()
-            else:
-                # Fall back to full text if the specific div isn't found
-                metadata_text = metadata_soup.get_text()
+            metadata_text = extract_metadata_text(metadata_html)
 
             # Extract institution from metadata
             institution = get_institution_from_metadata(metadata_text)
@@ -271,13 +453,14 @@ class BisScraper:
                 institution = "unknown"
 
             # Filter if institutions specified
-            if self.institutions is not None and institution.lower() not in [
-                i.lower() for i in self.institutions
-            ]:
+            if (
+                self._institution_filter is not None
+                and institution.lower() not in self._institution_filter
+            ):
                 logger.debug(
                     f"Skipping {speech_code} (institution {institution} not in filter)"
                 )
-                self.result.skipped += 1
+                self._add_counts(skipped=1)
                 return True
 
             # Create institution directory
@@ -289,62 +472,78 @@ class BisScraper:
                 speech_code[1:] if speech_code.startswith("r") else speech_code
             )
 
-            # Save metadata in JSON format only
-            save_metadata_to_json(inst_dir, code_without_r, metadata_text, date_obj)
+            # Save metadata in JSON format only (written in the background)
+            self._metadata_writer.submit(
+                inst_dir, code_without_r, build_metadata_entry(metadata_text, date_obj)
+            )
 
             # Format output filename
             output_filename = format_filename(speech_code, institution)
             output_path = inst_dir / output_filename
 
-            # Skip if file exists and not forcing download (second check in case the file was created in a different institution directory)
-            if output_path.exists() and not self.force_download:
+            # Skip if file exists and not forcing download (second check in case
+            # the file was created since the existing files cache was built;
+            # forced downloads don't need the stat)
+            if not self.force_download and output_path.exists():
                 # Print a message for the CLI that the speech already exists
                 skip_message = (
                     f"Skipping {speech_code} (already exists at {output_path})"
                 )
                 logger.debug(skip_message)
-                self.result.skipped += 1
+                self._add_counts(skipped=1)
                 return True
 
-            # Download the PDF
-            logger.debug(f"Downloading {pdf_url} to {output_path}")
-
-            pdf_response = requests.get(pdf_url, timeout=30)
-            pdf_response.raise_for_status()
+            # Stop if other downloads have already used up the limit
+            if not self._reserve_download():
+                return False
 
-            # Save PDF
-            with open(output_path, "wb") as pdf_file:
-                pdf_file.write(pdf_response.content)
+            downloaded = False
+            try:
+                # Download the PDF
+                logger.debug(f"Downloading {pdf_url} to {output_path}")
+
+                # Stream the PDF straight to disk instead of holding it in memory
+                with self._get(pdf_url, stream=True) as pdf_response:
+                    pdf_response.raise_for_status()
+                    # Let urllib3 undo any gzip/deflate content encoding
+                    pdf_response.raw.decode_content = True
+                    # Download next to the target and rename it into place, so
+                    # a crash can never leave a truncated PDF that later runs
+                    # would treat as cached
+                    part_path = output_path.with_suffix(".part")
+                    try:
+                        with open(part_path, "wb") as pdf_file:
+                            shutil.copyfileobj(
+                                pdf_response.raw, pdf_file, DOWNLOAD_CHUNK_SIZE
+                            )
+                        os.replace(part_path, output_path)
+                    except BaseException:
+                        part_path.unlink(missing_ok=True)
+                        raise
+                downloaded = True
+            finally:
+                limit_reached = self._release_download(downloaded)
 
             # Add to in-memory cache
-            self.existing_files.add(code_without_r)
+            with self._lock:
+                self.existing_files.add(code_without_r)
 
-            # Print download message for CLI feedback
-            download_message = f"Downloaded {speech_code} to {output_path}"
-            logger.info(download_message)
-            print(download_message)  # Print to stdout for CLI feedback
-            self.result.downloaded += 1
+            logger.info(f"Downloaded {speech_code} to {output_path}")
 
-            # Check if we've hit the limit - NEW CODE
-            if self.limit is not None and self.result.downloaded >= self.limit:
+            # Check if we've hit the limit
+            if limit_reached:
                 logger.info(
                     f"Reached download limit of {self.limit} speeches. Stopping."
                 )
-                print(
-                    f"Reached download limit of {self.limit} speeches at speech level. Stopping."
-                )
                 return False
 
-            # Sleep briefly to avoid overloading the server - only when actually downloading
-            time.sleep(0.5)
-
             return True
 
         except Exception as e:
             logger.error(
                 f"Error processing speech {speech_code}: {str(e)}", exc_info=True
             )
-            self.result.failed += 1
+            self._add_counts(failed=1)
             return True
 
     def get_results(self) -> ScrapingResult:
@@ -356,3 +555,8 @@ class BisScraper:
         # Save the date cache one final time
         self._save_date_cache()
         return self.result
+
+    def close(self) -> None:
+        """Write pending metadata and release the HTTP session."""
+        self._metadata_writer.close()
+        self.session.close()
@@ -3,12 +3,17 @@
 import datetime
 import logging
 import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
-from typing import Optional, Tuple
+from typing import List, Optional, Tuple
 
 from bis_scraper.models import ScrapingResult
 from bis_scraper.scrapers.bis_scraper import BisScraper
-from bis_scraper.utils.constants import RAW_DATA_DIR
+from bis_scraper.utils.constants import (
+    DEFAULT_REQUEST_INTERVAL,
+    DEFAULT_SCRAPE_WORKERS,
+    RAW_DATA_DIR,
+)
 from bis_scraper.utils.file_utils import create_directory
 from bis_scraper.utils.institution_utils import normalize_institution_name
 
@@ -23,6 +28,8 @@ def scrape_bis(
     institutions: Optional[Tuple[str, ...]] = None,
     force: bool = False,
     limit: Optional[int] = None,
+    workers: int = DEFAULT_SCRAPE_WORKERS,
+    request_interval: float = DEFAULT_REQUEST_INTERVAL,
 ) -> ScrapingResult:
     """Scrape speech data from the BIS website.
 
@@ -33,7 +40,14 @@ def scrape_bis(
         end_date: End date for scraping
         institutions: Specific institutions to scrape (default: all)
         force: Whether to force re-scraping existing files
-        limit: Maximum number of speeches to download per day
+        limit: Maximum number of speeches to download in total. With more
+            than one worker, dates are scraped concurrently and the limit is
+            filled by whichever of the dates in progress download first, so
+            the speeches kept near the limit may vary between runs (use
+            workers=1 for strictly chronological downloads)
+        workers: Number of dates scraped concurrently
+        request_interval: Minimum number of seconds between the start of two
+            requests to the BIS website
 
     Returns:
         ScrapingResult with statistics
@@ -75,6 +89,7 @@ def scrape_bis(
         institutions=normalized_institutions,
         force_download=force,
         limit=limit,  # Pass the limit to BisScraper for fine-grained control
+        request_interval=request_interval,
     )
 
     # Scrape data for each date in the range
@@ -91,46 +106,15 @@ def scrape_bis(
         f"Scraping speeches from {start_date_obj.isoformat()} to {end_date_obj.isoformat()} ({total_dates} days)"
     )
 
-    # Track progress
-    progress_interval = max(1, total_dates // 10)  # Report progress at 10% intervals
-
-    for i, date_obj in enumerate(date_range, 1):
-        try:
-            # Show progress at intervals
-            if i % progress_interval == 0 or i == total_dates:
-                progress_pct = (i / total_dates) * 100
-                logger.info(f"Progress: {i}/{total_dates} days ({progress_pct:.1f}%)")
-                print(f"Progress: {i}/{total_dates} days ({progress_pct:.1f}%)")
-
-            logger.info(f"Scraping data for {date_obj.isoformat()}")
-            should_continue = scraper.scrape_date(date_obj)
-
-            # Check if we need to stop (either from BisScraper's internal limit check or here)
-            if not should_continue or (
-                limit is not None and scraper.result.downloaded >= limit
-            ):
-                # If BisScraper didn't already log this (from internal check), log it here
-                if (
-                    should_continue
-                    and limit is not None
-                    and scraper.result.downloaded >= limit
-                ):
-                    logger.info(
-                        f"Reached download limit of {limit} speeches. Stopping."
-                    )
-                    print(
-                        f"Reached download limit of {limit} speeches at date level. Stopping."
-                    )
-                break
-
-        except Exception as e:
-            logger.error(
-                f"Error scraping data for {date_obj.isoformat()}: {str(e)}",
-                exc_info=True,
-            )
+    try:
+        _scrape_dates(scraper, date_range, workers)
 
-    # Get results
-    result = scraper.get_results()
+        # Get results
+        result = scraper.get_results()
+    finally:
+        # Stop the metadata writer thread and release the HTTP session even
+        # if scraping failed
+        scraper.close()
 
     # Log summary
     elapsed_time = time.time() - start_time
@@ -158,3 +142,64 @@ def scrape_bis(
     )
 
     return result
+
+
+def _scrape_dates(
+    scraper: BisScraper, date_range: List[datetime.date], workers: int
+) -> None:
+    """Scrape a range of dates concurrently until done or the limit is reached.
+
+    Args:
+        scraper: Shared scraper instance
+        date_range: Dates to scrape, in order
+        workers: Number of dates scraped concurrently
+    """
+    total_dates = len(date_range)
+
+    # Track progress
+    progress_interval = max(1, total_dates // 10)  # Report progress at 10% intervals
+
+    # Scraping is network-bound, so dates are fetched concurrently; the scraper
+    # serializes its shared state and enforces the download limit across threads
+    with ThreadPoolExecutor(max_workers=max(1, min(workers, total_dates))) as executor:
+        futures = {
+            executor.submit(_scrape_date, scraper, date_obj): date_obj
+            for date_obj in date_range
+        }
+
+        for i, future in enumerate(as_completed(futures), 1):
+            date_obj = futures[future]
+
+            # Show progress at intervals
+            if i % progress_interval == 0 or i == total_dates:
+                progress_pct = (i / total_dates) * 100
+                logger.info(f"Progress: {i}/{total_dates} days ({progress_pct:.1f}%)")
+
+            try:
+                should_continue = future.result()
+            except Exception as e:
+                logger.error(
+                    f"Error scraping data for {date_obj.isoformat()}: {str(e)}",
+                    exc_info=True,
+                )
+                continue
+
+            # Stop scheduling more dates once the download limit is reached
+            if not should_continue:
+                for pending in futures:
+                    pending.cancel()
+                break
+
+
+def _scrape_date(scraper: BisScraper, date_obj: datetime.date) -> bool:
+    """Scrape a single date (run in a worker thread).
+
+    Args:
+        scraper: Shared scraper instance
+        date_obj: Date to scrape
+
+    Returns:
+        bool: True if processing should continue, False if limit reached
+    """
+    logger.info(f"Scraping data for {date_obj.isoformat()}")
+    return scraper.scrape_date(date_obj)
@@ -1,47 +1,89 @@
 """Function to re-categorize files from unknown folder."""
 
+import errno
+import functools
 import json
 import logging
+import os
+import re
 import shutil
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import date, datetime
 from pathlib import Path
-from typing import Any, Dict, Optional, Tuple, cast
+from typing import Any, Dict, List, Match, Optional, Tuple, Union, cast
 
 import requests
-from bs4 import BeautifulSoup
 
 from bis_scraper.utils.constants import (
+    DEFAULT_REQUEST_INTERVAL,
     HTML_EXTENSION,
+    METADATA_FETCH_WORKERS,
     RAW_DATA_DIR,
     SPEECHES_URL,
     TXT_DATA_DIR,
 )
 from bis_scraper.utils.file_utils import (
+    build_metadata_entry,
+    find_existing_files,
     get_institution_directory,
-    save_metadata_to_json,
+    load_metadata_json,
+    write_metadata_json,
 )
-from bis_scraper.utils.institution_utils import get_institution_from_metadata
+from bis_scraper.utils.html_utils import extract_metadata_text
+from bis_scraper.utils.http_utils import RateLimiter, create_session
+from bis_scraper.utils.institution_utils import (
+    INSTITUTION_MAP_VERSION,
+    get_institution_from_metadata,
+)
+from bis_scraper.utils.json_utils import load_json_file
 
 logger = logging.getLogger(__name__)
 
+# Number of changes to the unknown folder's metadata.json kept in memory before
+# the file is rewritten (bounds the work lost if the process is killed)
+METADATA_FLUSH_INTERVAL = 50
+
+# Metadata field recording the institution mappings an entry was last
+# (unsuccessfully) looked up with
+INSTITUTION_LOOKUP_VERSION_KEY = "institution_lookup_version"
+
+# Whitespace allowed between JSON tokens
+_JSON_WHITESPACE_RE = re.compile(r"[ \t\n\r]*")
+
+# Institution lookups memoized by metadata text, so entries sharing the same
+# text are only matched against the institution patterns once
+_institution_for_text = functools.lru_cache(maxsize=4096)(get_institution_from_metadata)
 
-def recategorize_unknown_files(data_dir: Path) -> Tuple[int, int]:
+
+def recategorize_unknown_files(
+    data_dir: Path, request_interval: float = DEFAULT_REQUEST_INTERVAL
+) -> Tuple[int, int]:
     """Re-categorize files from unknown folder using updated institution mappings.
 
     This function checks the unknown folder and attempts to re-categorize files
     based on their metadata. This is useful when institution mappings are updated
     in constants.py after files have already been downloaded.
 
-    The function processes files sequentially and updates metadata.json immediately
-    after each successful move. This ensures that if the process fails, we don't
-    lose track of what was already processed.
+    Entries whose institution could not be found are marked with the
+    INSTITUTION_MAP_VERSION they were tried with and skipped on later runs
+    until the institution mappings change.
+
+    The function works in three phases:
+    1. Classify files with entries in metadata.json
+    2. Classify PDF files without metadata.json entries, fetching their
+       metadata from the BIS website concurrently (METADATA_FETCH_WORKERS
+       requests in flight, started at least request_interval seconds apart)
+    3. Move the classified files one institution at a time, writing each
+       institution's metadata.json once
 
-    The function processes:
-    1. Files with entries in metadata.json
-    2. PDF files without metadata.json entries (fetches metadata from BIS website)
+    Changes to the unknown folder's metadata.json are kept in memory and
+    written every METADATA_FLUSH_INTERVAL changes and when processing ends
+    (also on errors), rather than rewriting the whole file after every move.
 
     Args:
         data_dir: Base directory for data storage
+        request_interval: Minimum number of seconds between the start of two
+            metadata requests to the BIS website (0 disables rate limiting)
 
     Returns:
         Tuple of (files_recategorized, files_remaining) counts
@@ -58,89 +100,139 @@ def recategorize_unknown_files(data_dir: Path) -> Tuple[int, int]:
     # Load metadata.json if it exists
     metadata_data = _load_metadata_file(metadata_file)
 
-    # Get all PDF files in unknown folder
-    pdf_files = list(unknown_dir.glob("*.pdf"))
+    # Get the speech codes of all PDF files in unknown folder
+    # (from the filename, e.g., "000718b.pdf" -> "000718b")
+    pdf_codes = find_existing_files(unknown_dir, ".pdf")
 
     # If no PDFs and no metadata, nothing to do
-    if not pdf_files and not metadata_data:
+    if not pdf_codes and not metadata_data:
         return (0, 0)
 
     recategorized = 0
     processed_codes = set()
+    # Speeches to move, grouped by target institution:
+    # institution -> speech code -> (metadata text, metadata entry)
+    moves: Dict[str, Dict[str, Tuple[str, Dict[str, Any]]]] = {}
+    # Changes to metadata_data that have not been written to disk yet
+    pending_changes = 0
+    # Shared HTTP session for metadata fetches, created only when needed
+    session: Optional[requests.Session] = None
+
+    def record_change() -> None:
+        """Count a metadata change and write the file once enough have piled up."""
+        nonlocal pending_changes
+        pending_changes += 1
+        if pending_changes >= METADATA_FLUSH_INTERVAL:
+            _save_metadata_file(metadata_file, metadata_data)
+            pending_changes = 0
 
-    # First, process entries from metadata.json sequentially
-    # Process a copy of items to avoid modifying dict during iteration
-    for speech_code, metadata_entry in list(metadata_data.items()):
-        processed_codes.add(speech_code)
-        raw_text = metadata_entry.get("raw_text", "")
-        if not raw_text:
-            # Keep entry if no raw_text available (don't remove from metadata)
-            continue
-
-        # Try to extract institution from metadata
-        institution = get_institution_from_metadata(raw_text)
-
-        if institution:  # None means not found, any string means found
-            # Found a valid institution - move the files
-            if _move_files_to_institution(
-                unknown_dir,
-                data_dir,
-                speech_code,
-                institution,
-                raw_text,
-                metadata_entry,
-            ):
-                # Successfully moved - remove entry from metadata.json immediately
-                _remove_metadata_entry(metadata_file, speech_code)
-                recategorized += 1
-            # If move failed, keep entry in metadata.json (don't remove)
-        # If institution not found, keep entry in metadata.json (don't remove)
-
-    # Now process PDFs that don't have metadata.json entries
-    for pdf_path in pdf_files:
-        # Extract speech code from filename (e.g., "000718b.pdf" -> "000718b")
-        speech_code = pdf_path.stem
-
-        # Skip if already processed
-        if speech_code in processed_codes:
-            continue
-
-        # Fetch metadata from BIS website
-        logger.info(f"Fetching metadata for {speech_code} from BIS website")
-        metadata_text, date_obj = _fetch_metadata_from_bis(speech_code)
-
-        if not metadata_text:
-            # Could not fetch metadata, keep file in unknown
-            logger.warning(f"Could not fetch metadata for {speech_code}")
-            continue
-
-        # Try to extract institution from metadata
-        institution = get_institution_from_metadata(metadata_text)
-
-        if institution:
-            # Found a valid institution - move the files
-            metadata_entry = {
-                "raw_text": metadata_text,
-                "date": str(date_obj) if date_obj else None,
-            }
-            if _move_files_to_institution(
-                unknown_dir,
-                data_dir,
-                speech_code,
-                institution,
-                metadata_text,
-                metadata_entry,
+    try:
+        # First, classify entries from metadata.json
+        # Process a copy of items to avoid modifying dict during iteration
+        for speech_code, metadata_entry in list(metadata_data.items()):
+            processed_codes.add(speech_code)
+            raw_text = metadata_entry.get("raw_text", "")
+            if not raw_text:
+                # Keep entry if no raw_text available (don't remove from metadata)
+                continue
+
+            # Skip entries that already failed with the current mappings
+            lookup_version = metadata_entry.get(INSTITUTION_LOOKUP_VERSION_KEY)
+            if lookup_version == INSTITUTION_MAP_VERSION:
+                continue
+
+            # Try to extract institution from metadata
+            institution = _institution_for_text(raw_text)
+
+            if institution:  # None means not found, any string means found
+                # Found a valid institution - move the files if there are any
+                # (without the lookup bookkeeping, which only matters in the
+                # unknown folder); otherwise keep the entry in metadata.json
+                if speech_code in pdf_codes:
+                    moves.setdefault(institution, {})[speech_code] = (
+                        raw_text,
+                        {
+                            key: value
+                            for key, value in metadata_entry.items()
+                            if key != INSTITUTION_LOOKUP_VERSION_KEY
+                        },
+                    )
+            else:
+                # Institution not found, keep entry in metadata.json and
+                # remember which mappings were tried
+                metadata_entry[INSTITUTION_LOOKUP_VERSION_KEY] = INSTITUTION_MAP_VERSION
+                record_change()
+
+        # Then classify PDFs that don't have metadata.json entries
+        pending_codes = [code for code in pdf_codes if code not in processed_codes]
+        if pending_codes:
+            session = create_session()
+            rate_limiter = RateLimiter(request_interval)
+
+            def fetch(code: str) -> Tuple[Optional[str], Optional[date]]:
+                """Fetch metadata for a speech code from the BIS website."""
+                rate_limiter.wait()
+                logger.info(f"Fetching metadata for {code} from BIS website")
+                return _fetch_metadata_from_bis(code, session)
+
+            # Fetching is network-bound, so pages are requested concurrently;
+            # results are classified here one at a time as they arrive
+            with ThreadPoolExecutor(
+                max_workers=min(METADATA_FETCH_WORKERS, len(pending_codes))
+            ) as executor:
+                futures = {executor.submit(fetch, code): code for code in pending_codes}
+                for future in as_completed(futures):
+                    speech_code = futures[future]
+                    metadata_text, date_obj = future.result()
+
+                    if not metadata_text:
+                        # Could not fetch metadata, keep file in unknown
+                        logger.warning(f"Could not fetch metadata for {speech_code}")
+                        continue
+
+                    # Try to extract institution from metadata
+                    institution = _institution_for_text(metadata_text)
+
+                    if institution:
+                        # Found a valid institution - move the files
+                        moves.setdefault(institution, {})[speech_code] = (
+                            metadata_text,
+                            {
+                                "raw_text": metadata_text,
+                                "date": str(date_obj) if date_obj else None,
+                            },
+                        )
+                    else:
+                        # Still unknown - add to metadata.json for future processing
+                        metadata_data[speech_code] = {
+                            "raw_text": metadata_text,
+                            "date": str(date_obj) if date_obj else None,
+                            INSTITUTION_LOOKUP_VERSION_KEY: INSTITUTION_MAP_VERSION,
+                        }
+                        record_change()
+
+        # Finally move the files, one institution at a time
+        for institution in sorted(moves):
+            for speech_code in _move_speeches_to_institution(
+                unknown_dir, data_dir, institution, moves[institution]
             ):
-                # Successfully moved - no metadata entry to remove (wasn't in metadata.json)
+                # Successfully moved - remove entry from metadata.json (PDFs
+                # whose metadata was fetched have no entry to remove)
+                if metadata_data.pop(speech_code, None) is not None:
+                    record_change()
                 recategorized += 1
-            # If move failed, file stays in unknown folder
-        else:
-            # Still unknown - add to metadata.json for future processing
-            _add_metadata_entry(metadata_file, speech_code, metadata_text, date_obj)
+            # If a move failed, its files and entry stay in the unknown folder
+    finally:
+        # Write whatever is still pending, also when processing was interrupted
+        if pending_changes:
+            _save_metadata_file(metadata_file, metadata_data)
+        if session is not None:
+            session.close()
 
     # Final cleanup: check if metadata.json should be deleted
-    remaining_pdfs = list(unknown_dir.glob("*.pdf"))
-    remaining_metadata = _load_metadata_file(metadata_file)
+    # (the cleanup below never removes PDFs, so this listing stays valid)
+    remaining_pdfs = find_existing_files(unknown_dir, ".pdf")
+    remaining_metadata = metadata_data
 
     if not remaining_metadata and not remaining_pdfs:
         # No remaining files and no PDFs, safe to delete metadata.json
@@ -162,7 +254,7 @@ def recategorize_unknown_files(data_dir: Path) -> Tuple[int, int]:
         if unknown_texts_dir.exists():
             try:
                 # Check if folder is empty (only check for .txt files, ignore other files)
-                txt_files = list(unknown_texts_dir.glob("*.txt"))
+                txt_files = find_existing_files(unknown_texts_dir, ".txt")
                 if not txt_files:
                     unknown_texts_dir.rmdir()
                     logger.info("Removed empty unknown texts folder")
@@ -171,14 +263,9 @@ def recategorize_unknown_files(data_dir: Path) -> Tuple[int, int]:
                 pass
 
     # Calculate remaining count before logging
-    remaining_pdfs_final = list(unknown_dir.glob("*.pdf"))
-    pdf_codes_final = {p.stem for p in remaining_pdfs_final}
-    pdf_codes_with_metadata_final = set(remaining_metadata.keys())
     # Count: PDFs without metadata + metadata entries without PDFs
-    overlap_final = len(pdf_codes_final & pdf_codes_with_metadata_final)
-    remaining_count = (
-        len(remaining_pdfs_final) + len(remaining_metadata) - overlap_final
-    )
+    overlap_final = sum(1 for code in remaining_metadata if code in remaining_pdfs)
+    remaining_count = len(remaining_pdfs) + len(remaining_metadata) - overlap_final
     # Ensure count is never negative
     remaining_count = max(0, remaining_count)
 
@@ -204,103 +291,99 @@ def _load_metadata_file(metadata_file: Path) -> Dict[str, Any]:
         return {}
 
     try:
-        with open(metadata_file, "r", encoding="utf-8") as f:
-            content = f.read()
-            # Try to parse JSON, handling corrupted files
-            try:
-                return cast(Dict[str, Any], json.loads(content))
-            except json.JSONDecodeError as e:
-                # If JSON is corrupted, try to extract valid JSON portion
-                logger.warning(
-                    f"JSON parse error in metadata.json: {e}. Attempting to recover..."
-                )
-                # Try to find the end of valid JSON
-                if e.pos and e.pos > 0:
-                    try:
-                        # Try parsing up to the error position
-                        recovered_data = cast(
-                            Dict[str, Any], json.loads(content[: e.pos])
-                        )
-                        logger.info(
-                            f"Recovered {len(recovered_data)} entries from corrupted metadata.json"
-                        )
-                        return recovered_data
-                    except json.JSONDecodeError:
-                        logger.error(
-                            "Could not recover metadata.json. File may be severely corrupted."
-                        )
-                        return {}
-                else:
-                    logger.error("Could not recover metadata.json")
-                    return {}
+        return cast(Dict[str, Any], load_json_file(metadata_file))
+    except ValueError as e:
+        # If JSON is corrupted, try to extract the valid entries
+        logger.warning(
+            f"JSON parse error in metadata.json: {e}. Attempting to recover..."
+        )
     except IOError as e:
         logger.warning(f"Error reading metadata.json: {e}")
         return {}
 
+    try:
+        content = metadata_file.read_text(encoding="utf-8", errors="replace")
+    except IOError as e:
+        logger.warning(f"Error reading metadata.json: {e}")
+        return {}
 
-def _remove_metadata_entry(metadata_file: Path, speech_code: str) -> None:
-    """Remove a single entry from metadata.json atomically.
+    recovered_data = _recover_metadata_entries(content)
+    if recovered_data:
+        logger.info(
+            f"Recovered {len(recovered_data)} entries from corrupted metadata.json"
+        )
+    else:
+        logger.error("Could not recover metadata.json. File may be severely corrupted.")
+    return recovered_data
+
+
+def _recover_metadata_entries(content: str) -> Dict[str, Any]:
+    """Decode the entries of a damaged metadata.json up to the damage.
+
+    The top-level object is decoded one key and value at a time, so every
+    complete entry before the first damaged one is kept (e.g. all but the last
+    entry of a truncated file).
 
     Args:
-        metadata_file: Path to metadata.json file
-        speech_code: Speech code to remove
+        content: Content of the metadata.json file
+
+    Returns:
+        Dictionary of the entries that could be decoded
     """
-    if not metadata_file.exists():
-        return
+    decoder = json.JSONDecoder()
+    entries: Dict[str, Any] = {}
 
-    try:
-        # Load current metadata
-        metadata_data = _load_metadata_file(metadata_file)
-        if speech_code not in metadata_data:
-            return
+    def skip_whitespace(pos: int) -> int:
+        """Return the position of the next non-whitespace character."""
+        return cast(Match[str], _JSON_WHITESPACE_RE.match(content, pos)).end()
 
-        # Remove entry
-        del metadata_data[speech_code]
+    pos = skip_whitespace(0)
+    if not content.startswith("{", pos):
+        return entries
+    pos = skip_whitespace(pos + 1)
 
-        # Write back (atomic write)
-        with open(metadata_file, "w", encoding="utf-8") as f:
-            json.dump(metadata_data, f, indent=2, ensure_ascii=False)
-    except Exception as e:
-        logger.error(
-            f"Error removing metadata entry for {speech_code}: {e}", exc_info=True
-        )
+    while True:
+        try:
+            key, pos = decoder.raw_decode(content, pos)
+            pos = skip_whitespace(pos)
+            if not isinstance(key, str) or not content.startswith(":", pos):
+                break
+            value, pos = decoder.raw_decode(content, skip_whitespace(pos + 1))
+        except json.JSONDecodeError:
+            break
+        entries[key] = value
+
+        # Another entry follows a comma; anything else ends the object
+        pos = skip_whitespace(pos)
+        if not content.startswith(",", pos):
+            break
+        pos = skip_whitespace(pos + 1)
 
+    return entries
 
-def _add_metadata_entry(
-    metadata_file: Path, speech_code: str, metadata_text: str, date_obj: Optional[date]
-) -> None:
-    """Add a single entry to metadata.json atomically.
+
+def _save_metadata_file(metadata_file: Path, metadata_data: Dict[str, Any]) -> None:
+    """Write all entries of the unknown folder's metadata.json file.
 
     Args:
         metadata_file: Path to metadata.json file
-        speech_code: Speech code to add
-        metadata_text: Raw metadata text
-        date_obj: Optional date object
+        metadata_data: Metadata entries keyed by speech code
     """
     try:
-        # Load current metadata
-        metadata_data = _load_metadata_file(metadata_file)
-
-        # Add entry
-        metadata_data[speech_code] = {
-            "raw_text": metadata_text,
-            "date": str(date_obj) if date_obj else None,
-        }
-
-        # Write back (atomic write)
-        with open(metadata_file, "w", encoding="utf-8") as f:
-            json.dump(metadata_data, f, indent=2, ensure_ascii=False)
+        write_metadata_json(metadata_file.parent, metadata_data)
     except Exception as e:
-        logger.error(
-            f"Error adding metadata entry for {speech_code}: {e}", exc_info=True
-        )
+        logger.error(f"Error writing {metadata_file}: {e}", exc_info=True)
 
 
-def _fetch_metadata_from_bis(speech_code: str) -> Tuple[Optional[str], Optional[date]]:
+def _fetch_metadata_from_bis(
+    speech_code: str, session: Optional[requests.Session] = None
+) -> Tuple[Optional[str], Optional[date]]:
     """Fetch metadata from BIS website for a speech code.
 
     Args:
         speech_code: Speech code without 'r' prefix (e.g., "000718b")
+        session: HTTP session to reuse across calls (a new one is created
+            if not given)
 
     Returns:
         Tuple of (metadata_text, date_obj) or (None, None) if fetch failed
@@ -315,19 +398,15 @@ def _fetch_metadata_from_bis(speech_code: str) -> Tuple[Optional[str], Optional[
         metadata_url = f"{SPEECHES_URL}/{full_code}{HTML_EXTENSION}"
 
         # Get the metadata page
-        metadata_response = requests.get(metadata_url, timeout=30)
+        if session is None:
+            with create_session() as own_session:
+                metadata_response = own_session.get(metadata_url, timeout=30)
+        else:
+            metadata_response = session.get(metadata_url, timeout=30)
         metadata_response.raise_for_status()
 
-        # Parse metadata page
-        metadata_soup = BeautifulSoup(metadata_response.text, "html.parser")
-
         # Extract metadata - specifically look for extratitle-div
-        extratitle_div = metadata_soup.find(id="extratitle-div")
-        if extratitle_div:
-            metadata_text = extratitle_div.text.strip()
-        else:
-            # Fall back to full text if the specific div isn't found
-            metadata_text = metadata_soup.get_text()
+        metadata_text = extract_metadata_text(metadata_response.text)
 
         # Try to extract date from speech code (YYMMDD format)
         date_obj = None
@@ -341,7 +420,7 @@ def _fetch_metadata_from_bis(speech_code: str) -> Tuple[Optional[str], Optional[
                     year += 2000
                 else:
                     year += 1900
-                date_obj = datetime(year, month, day).date()
+                date_obj = date(year, month, day)
             except (ValueError, IndexError):
                 pass
 
@@ -351,112 +430,138 @@ def _fetch_metadata_from_bis(speech_code: str) -> Tuple[Optional[str], Optional[
         return (None, None)
 
 
-def _move_files_to_institution(
+def _move_file(source: Union[str, Path], target: Union[str, Path]) -> None:
+    """Move a file, replacing any existing file at the target path.
+
+    The data folders normally share a filesystem, where a single rename is
+    enough; shutil.move (copy and delete) is only used across filesystems.
+
+    Args:
+        source: File to move
+        target: Destination file path
+    """
+    try:
+        os.replace(source, target)
+    except OSError as e:
+        if e.errno != errno.EXDEV:
+            raise
+        shutil.move(str(source), str(target))
+
+
+def _move_speeches_to_institution(
     unknown_dir: Path,
     data_dir: Path,
-    speech_code: str,
     institution: str,
-    metadata_text: str,
-    metadata_entry: dict,
-) -> bool:
-    """Move PDF and text files from unknown folder to institution folder.
+    speeches: Dict[str, Tuple[str, Dict[str, Any]]],
+) -> List[str]:
+    """Move PDF and text files of speeches from unknown folder to an institution folder.
+
+    The institution's metadata.json is updated once for all speeches, before
+    any file is moved, so an interrupted run never leaves moved files without
+    metadata (the files still in the unknown folder are moved by a later run).
 
     Args:
         unknown_dir: Unknown directory path
         data_dir: Base data directory
-        speech_code: Speech code without 'r' prefix
         institution: Institution name
-        metadata_text: Raw metadata text
-        metadata_entry: Metadata entry dictionary
+        speeches: Speeches to move, mapping each speech code (without 'r'
+            prefix) to its raw metadata text and metadata entry dictionary
 
     Returns:
-        True if files were moved successfully, False otherwise
+        Speech codes of the speeches whose files were moved
     """
     try:
-        pdf_filename = f"{speech_code}.pdf"
-        txt_filename = f"{speech_code}.txt"
-        pdf_path = unknown_dir / pdf_filename
-
-        if not pdf_path.exists():
-            return False
-
         # Get target institution directories
-        output_dir = data_dir / RAW_DATA_DIR
-        target_pdf_dir = get_institution_directory(output_dir, institution)
-        target_pdf_path = target_pdf_dir / pdf_filename
+        target_pdf_dir = get_institution_directory(data_dir / RAW_DATA_DIR, institution)
+        target_txt_dir = get_institution_directory(data_dir / TXT_DATA_DIR, institution)
 
-        # Get text directories
-        texts_dir = data_dir / TXT_DATA_DIR
-        unknown_texts_dir = texts_dir / "unknown"
-        target_txt_dir = get_institution_directory(texts_dir, institution)
-        txt_path = unknown_texts_dir / txt_filename
-        target_txt_path = target_txt_dir / txt_filename
-
-        # Move PDF file
-        shutil.move(str(pdf_path), str(target_pdf_path))
-        logger.info(f"Re-categorized {speech_code} PDF from unknown to {institution}")
-
-        # Move text file if it exists
-        if txt_path.exists():
-            # Ensure target text directory exists
-            target_txt_dir.mkdir(parents=True, exist_ok=True)
-            shutil.move(str(txt_path), str(target_txt_path))
-            logger.info(
-                f"Re-categorized {speech_code} text file from unknown to {institution}"
+        # Save metadata to target directory
+        target_metadata = load_metadata_json(target_pdf_dir)
+        for speech_code, (metadata_text, metadata_entry) in speeches.items():
+            target_metadata[speech_code] = _build_target_metadata_entry(
+                metadata_text, metadata_entry
             )
+        write_metadata_json(target_pdf_dir, target_metadata)
+    except Exception as e:
+        logger.error(
+            f"Error saving metadata for {institution}: {e}",
+            exc_info=True,
+        )
+        return []
 
-        # Save metadata to target directory
-        # Preserve existing structured metadata from metadata_entry if available
-        json_path = target_pdf_dir / "metadata.json"
+    # The loop builds plain string paths from these prefixes rather than Path
+    # objects, as it runs once per speech
+    unknown_pdf_prefix = os.path.join(unknown_dir, "")
+    unknown_txt_prefix = os.path.join(data_dir / TXT_DATA_DIR / "unknown", "")
+    target_pdf_prefix = os.path.join(target_pdf_dir, "")
+    target_txt_prefix = os.path.join(target_txt_dir, "")
 
-        # Check if metadata_entry has structured fields (more than raw_text and date)
-        has_structured_metadata = len(metadata_entry) > 2 or any(
-            key not in ("raw_text", "date") for key in metadata_entry.keys()
-        )
+    moved: List[str] = []
+    for speech_code in speeches:
+        pdf_filename = f"{speech_code}.pdf"
+        txt_filename = f"{speech_code}.txt"
 
-        if json_path.exists():
-            try:
-                with open(json_path, "r", encoding="utf-8") as f:
-                    existing_data = json.load(f)
-            except (IOError, json.JSONDecodeError):
-                existing_data = {}
-
-            # If we have structured metadata in metadata_entry, preserve it
-            if has_structured_metadata:
-                # Merge: preserve structured fields, update raw_text and date
-                existing_data[speech_code] = {
-                    **metadata_entry,  # Preserve all structured fields
-                    "raw_text": metadata_text.strip(),  # Update raw_text
-                }
-                # Ensure date is in ISO format if provided
-                date_str = metadata_entry.get("date")
-                if date_str:
-                    existing_data[speech_code]["date"] = date_str
-                # Write back
-                with open(json_path, "w", encoding="utf-8") as f:
-                    json.dump(existing_data, f, indent=2, ensure_ascii=False)
-                return True
-
-        # No structured metadata in metadata_entry, use normal save (will parse)
-        date_str = metadata_entry.get("date")
-        date_obj = None
-        if date_str:
+        try:
+            # Move PDF file
+            _move_file(
+                unknown_pdf_prefix + pdf_filename, target_pdf_prefix + pdf_filename
+            )
+            logger.info(
+                f"Re-categorized {speech_code} PDF from unknown to {institution}"
+            )
+
+            # Move text file if it exists
             try:
-                # Handle both ISO format and string format
-                if isinstance(date_str, str) and len(date_str) == 10:
-                    date_obj = datetime.fromisoformat(date_str).date()
-                elif isinstance(date_str, str):
-                    # Try parsing as date string
-                    date_obj = datetime.strptime(date_str, "%Y-%m-%d").date()
-            except ValueError:
+                _move_file(
+                    unknown_txt_prefix + txt_filename, target_txt_prefix + txt_filename
+                )
+            except FileNotFoundError:
                 pass
+            else:
+                logger.info(
+                    f"Re-categorized {speech_code} text file from unknown to {institution}"
+                )
+        except Exception as e:
+            logger.error(
+                f"Error moving {speech_code} to {institution}: {e}",
+                exc_info=True,
+            )
+            continue
 
-        save_metadata_to_json(target_pdf_dir, speech_code, metadata_text, date_obj)
+        moved.append(speech_code)
 
-        return True
-    except Exception as e:
-        logger.error(
-            f"Error moving {speech_code} to {institution}: {e}",
-            exc_info=True,
-        )
-        return False
+    return moved
+
+
+def _build_target_metadata_entry(
+    metadata_text: str, metadata_entry: Dict[str, Any]
+) -> Dict[str, Any]:
+    """Build the metadata.json entry of a speech moved to an institution folder.
+
+    Args:
+        metadata_text: Raw metadata text
+        metadata_entry: Metadata entry dictionary from the unknown folder
+
+    Returns:
+        The entry with its structured fields preserved if it has any (more
+        than raw_text and date), otherwise newly parsed from the raw text
+    """
+    if any(key not in ("raw_text", "date") for key in metadata_entry):
+        # Preserve structured fields, update raw_text
+        return {**metadata_entry, "raw_text": metadata_text.strip()}
+
+    # No structured metadata in metadata_entry, parse the raw text
+    date_str = metadata_entry.get("date")
+    date_obj = None
+    if date_str:
+        try:
+            # Handle both ISO format and string format
+            if isinstance(date_str, str) and len(date_str) == 10:
+                date_obj = date.fromisoformat(date_str)
+            elif isinstance(date_str, str):
+                # Try parsing as date string
+                date_obj = datetime.strptime(date_str, "%Y-%m-%d").date()
+        except ValueError:
+            pass
+
+    return build_metadata_entry(metadata_text, date_obj)
@@ -0,0 +1,157 @@
+"""Background writer for speech metadata files."""
+
+import atexit
+import logging
+import queue
+import threading
+from pathlib import Path
+from typing import Any, Dict, Set, Tuple, Union
+
+from bis_scraper.utils.file_utils import load_metadata_json, write_metadata_json
+
+logger = logging.getLogger(__name__)
+
+# (institution directory, speech code, metadata entry)
+_MetadataItem = Tuple[Path, str, Dict[str, Any]]
+# Queued work: an entry, a flush request (set once written) or None to stop
+_QueueItem = Union[_MetadataItem, threading.Event, None]
+
+# Seconds between checks that the writer thread is still alive during flush()
+_FLUSH_POLL_INTERVAL = 1.0
+
+
+class AsyncMetadataWriter:
+    """Write speech metadata to metadata.json files from a background thread.
+
+    Entries are queued by the scraper threads and merged by a single writer
+    thread into an in-memory copy of each institution's metadata.json, which
+    is read from disk only once. Files are rewritten only on flush() and
+    close(), so a run serializes each file a handful of times instead of once
+    per speech, and concurrent scraper threads cannot overwrite each other's
+    entries.
+    """
+
+    def __init__(self) -> None:
+        """Initialize the writer and start its background thread."""
+        self._queue: "queue.Queue[_QueueItem]" = queue.Queue()
+        self._data: Dict[Path, Dict[str, Dict[str, Any]]] = {}
+        self._dirty: Set[Path] = set()
+        self._closed = False
+        self._thread = threading.Thread(
+            target=self._run, name="metadata-writer", daemon=True
+        )
+        self._thread.start()
+        # Make sure queued entries reach disk if the caller never closes us
+        atexit.register(self.close)
+
+    def submit(
+        self, institution_dir: Path, speech_code: str, metadata: Dict[str, Any]
+    ) -> None:
+        """Queue a metadata entry to be written.
+
+        Args:
+            institution_dir: Directory for the institution
+            speech_code: Speech code (without 'r' prefix, e.g., "220101a")
+            metadata: Metadata entry for the speech
+
+        Raises:
+            RuntimeError: If the writer has been closed
+        """
+        if self._closed:
+            raise RuntimeError("Metadata writer is closed")
+        self._queue.put((institution_dir, speech_code, metadata))
+
+    def flush(self) -> None:
+        """Block until all entries submitted so far have been written.
+
+        Raises:
+            RuntimeError: If the background thread has stopped unexpectedly
+        """
+        if self._closed:
+            return
+        self._check_alive()
+        written = threading.Event()
+        self._queue.put(written)
+        # Poll so that a writer thread that dies can't block us forever
+        while not written.wait(_FLUSH_POLL_INTERVAL):
+            self._check_alive()
+
+    def close(self) -> None:
+        """Write all queued entries and stop the background thread.
+
+        Raises:
+            RuntimeError: If the background thread had stopped unexpectedly,
+                in which case queued entries may not have been written
+        """
+        if self._closed:
+            return
+        self._closed = True
+        atexit.unregister(self.close)
+        self._check_alive()
+        self._queue.put(None)
+        self._thread.join()
+
+    def _check_alive(self) -> None:
+        """Raise if the background thread is no longer running.
+
+        Raises:
+            RuntimeError: If the background thread has stopped
+        """
+        if not self._thread.is_alive():
+            raise RuntimeError("Metadata writer thread has stopped unexpectedly")
+
+    def _run(self) -> None:
+        """Apply queued entries until the writer is closed."""
+        while True:
+            item = self._queue.get()
+            if item is None:
+                self._write_dirty()
+                return
+            if isinstance(item, threading.Event):
+                try:
+                    self._write_dirty()
+                finally:
+                    # Never leave a flush() caller waiting
+                    item.set()
+                continue
+
+            try:
+                self._apply(item)
+            except Exception as e:
+                # Keep the thread alive for the remaining entries
+                logger.error(
+                    f"Error applying metadata for {item[1]}: {str(e)}", exc_info=True
+                )
+
+    def _apply(self, item: _MetadataItem) -> None:
+        """Merge a queued entry into the in-memory metadata of its institution.
+
+        Args:
+            item: Institution directory, speech code and metadata entry
+        """
+        institution_dir, speech_code, metadata = item
+        if institution_dir not in self._data:
+            self._data[institution_dir] = load_metadata_json(institution_dir)
+        data = self._data[institution_dir]
+        # Rescraped speeches usually have identical metadata; only
+        # changed entries make the file worth rewriting
+        if data.get(speech_code) != metadata:
+            data[speech_code] = metadata
+            self._dirty.add(institution_dir)
+
+    def _write_dirty(self) -> None:
+        """Write every metadata.json file that has unwritten entries.
+
+        Files that fail to write stay dirty, so they are retried at the next
+        flush or on close.
+        """
+        for institution_dir in sorted(self._dirty):
+            try:
+                write_metadata_json(institution_dir, self._data[institution_dir])
+            except Exception as e:
+                logger.error(
+                    f"Error writing metadata for {institution_dir}: {str(e)}",
+                    exc_info=True,
+                )
+            else:
+                self._dirty.discard(institution_dir)
@@ -172,6 +172,31 @@ TXT_DATA_DIR = "texts"
 # URLs for speech listing page
 SPEECHES_URL = "https://www.bis.org/review"
 
+# Number of dates scraped concurrently by default
+DEFAULT_SCRAPE_WORKERS = 4
+
+# Number of speech metadata pages fetched concurrently during recategorization
+METADATA_FETCH_WORKERS = 8
+
+# Minimum number of seconds between the start of two requests to the BIS website
+DEFAULT_REQUEST_INTERVAL = 0.25
+
+# Chunk size used when streaming PDF downloads to disk
+DOWNLOAD_CHUNK_SIZE = 64 * 1024
+
+# PDF text extraction backends (the first one is the default)
+PDF_BACKENDS = ("pdfium", "textract")
+DEFAULT_PDF_BACKEND = PDF_BACKENDS[0]
+
+# Date cache (stored in the PDF directory): a JSON snapshot, plus a journal of
+# dates checked since the snapshot was last written
+DATE_CACHE_NAME = ".bis_scraper_date_cache.json"
+DATE_CACHE_JOURNAL_NAME = ".bis_scraper_date_cache.ndjson"
+
+# Optional HTTP response cache (stored in the data directory)
+HTTP_CACHE_NAME = ".http_cache"
+HTTP_CACHE_EXPIRE_SECONDS = 24 * 60 * 60
+
 # Institution name mappings for standardization
 INSTITUTION_ALIASES: Dict[str, List[str]] = {
     "board of governors of the federal reserve system": [
@@ -1,14 +1,25 @@
 """File utility functions for the BIS Scraper package."""
 
 import hashlib
-import json
 import logging
+import os
 import re
+import sys
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Set
+from typing import Any, Dict, List, Optional, Set, Tuple
+
+from bis_scraper.utils.institution_utils import normalize_institution_name
+from bis_scraper.utils.json_utils import dump_json_file, load_json_file
 
 logger = logging.getLogger(__name__)
 
+# Chunk size used when hashing files
+_HASH_CHUNK_SIZE = 1024 * 1024
+
+# Parsed metadata.json files with the (mtime_ns, size) they had when read or
+# written, so unchanged files are not parsed again
+_metadata_cache: Dict[Path, Tuple[int, int, Dict[str, Dict[str, Any]]]] = {}
+
 
 def create_directory(directory: Path) -> None:
     """Create a directory if it doesn't exist.
@@ -16,9 +27,12 @@ def create_directory(directory: Path) -> None:
     Args:
         directory: Directory path to create
     """
-    if not directory.exists():
-        directory.mkdir(parents=True, exist_ok=True)
-        logger.debug(f"Created directory: {directory}")
+    try:
+        directory.mkdir(parents=True)
+    except FileExistsError:
+        # Already there (or created concurrently by another thread)
+        return
+    logger.debug(f"Created directory: {directory}")
 
 
 def get_file_hash(file_path: Path) -> str:
@@ -30,12 +44,20 @@ def get_file_hash(file_path: Path) -> str:
     Returns:
         SHA-256 hash as hex string
     """
+    if sys.version_info >= (3, 11):
+        # The read and hash loop runs entirely in C
+        with open(file_path, "rb") as f:
+            return hashlib.file_digest(f, "sha256").hexdigest()
+
     hash_obj = hashlib.sha256()
 
-    with open(file_path, "rb") as f:
-        # Read in chunks to handle large files
-        for chunk in iter(lambda: f.read(4096), b""):
-            hash_obj.update(chunk)
+    # Read in large chunks into one reused buffer to handle large files
+    # without allocating a new bytes object (and a Python call) per 4 KiB
+    buffer = bytearray(_HASH_CHUNK_SIZE)
+    view = memoryview(buffer)
+    with open(file_path, "rb", buffering=0) as f:
+        while size := f.readinto(buffer):
+            hash_obj.update(view[:size])
 
     return hash_obj.hexdigest()
 
@@ -49,10 +71,13 @@ def list_directories(base_dir: Path) -> List[str]:
     Returns:
         List of directory names (not full paths)
     """
-    if not base_dir.exists():
+    try:
+        entries = os.scandir(base_dir)
+    except FileNotFoundError:
         return []
 
-    return [d.name for d in base_dir.iterdir() if d.is_dir()]
+    with entries:
+        return [e.name for e in entries if e.is_dir()]
 
 
 def find_existing_files(directory: Path, extension: str) -> Set[str]:
@@ -66,40 +91,25 @@ def find_existing_files(directory: Path, extension: str) -> Set[str]:
         Set of file codes (without extension)
     """
     result: Set[str] = set()
-    if not directory.exists():
+
+    # scandir avoids glob's pattern matching and a Path object per entry; a
+    # missing directory is detected by scandir itself instead of a separate stat
+    try:
+        entries = os.scandir(directory)
+    except FileNotFoundError:
         return result
 
-    for file_path in directory.glob(f"*{extension}"):
-        # Extract the code part from filename (e.g., "220101a" from "220101a.pdf")
-        filename = file_path.stem
-        result.add(filename)
+    ext_len = len(extension)
+    with entries:
+        for entry in entries:
+            name = entry.name
+            if name.endswith(extension) and entry.is_file():
+                # Extract the code part from filename (e.g., "220101a" from "220101a.pdf")
+                result.add(name[:-ext_len])
 
     return result
 
 
-def normalize_institution_name(name: str) -> str:
-    """Normalize an institution name for use in filenames and directories.
-
-    Args:
-        name: Institution name
-
-    Returns:
-        Normalized name with spaces converted to underscores and lowercase
-    """
-    # Convert to lowercase for consistency
-    normalized = name.lower()
-
-    # Replace spaces with underscores
-    normalized = normalized.replace(" ", "_")
-
-    # Replace special characters
-    normalized = normalized.replace("'", "")
-    normalized = normalized.replace(",", "")
-    normalized = normalized.replace("&", "and")
-
-    return normalized
-
-
 def get_institution_directory(base_dir: Path, institution: str) -> Path:
     """Get or create directory for an institution.
 
@@ -143,41 +153,155 @@ def save_metadata_to_json(
 ) -> None:
     """Save speech metadata to a JSON file.
 
+    Nothing is parsed or written if the file already holds an entry for the
+    speech with the same raw text and date.
+
     Args:
         institution_dir: Directory for the institution
         speech_code: Speech code (without 'r' prefix, e.g., "220101a")
         metadata_text: Raw metadata text from the speech page
         date_obj: Date object of the speech
     """
-    json_path = institution_dir / "metadata.json"
+    data = load_metadata_json(institution_dir)
 
-    # Initialize data structure or load existing
-    if json_path.exists():
-        try:
-            with open(json_path, "r", encoding="utf-8") as f:
-                data = json.load(f)
-        except json.JSONDecodeError:
-            logger.warning(f"Invalid JSON in {json_path}, creating new file")
-            data = {}
-    else:
-        data = {}
+    existing = data.get(speech_code)
+    if (
+        existing is not None
+        and existing.get("raw_text") == metadata_text.strip()
+        and existing.get("date") == (date_obj.isoformat() if date_obj else None)
+    ):
+        return
+
+    data[speech_code] = build_metadata_entry(metadata_text, date_obj)
+    write_metadata_json(institution_dir, data)
+
+
+def build_metadata_entry(
+    metadata_text: str, date_obj: Optional[Any] = None
+) -> Dict[str, Any]:
+    """Build the metadata.json entry for a speech.
+
+    Args:
+        metadata_text: Raw metadata text from the speech page
+        date_obj: Date object of the speech
 
+    Returns:
+        Dictionary with the raw text, structured fields and date
+    """
     # Extract structured information from metadata text
     structured_metadata = parse_metadata_text(metadata_text)
 
     # Create metadata entry
-    metadata = {"raw_text": metadata_text.strip(), **structured_metadata}
+    metadata: Dict[str, Any] = {
+        "raw_text": metadata_text.strip(),
+        **structured_metadata,
+    }
 
     # Add date if provided
     if date_obj:
         metadata["date"] = date_obj.isoformat()
 
-    # Add or update entry
-    data[speech_code] = metadata
+    return metadata
+
+
+def update_metadata_json(
+    institution_dir: Path, entries: Dict[str, Dict[str, Any]]
+) -> None:
+    """Add or replace entries in an institution's metadata.json file.
+
+    Args:
+        institution_dir: Directory for the institution
+        entries: Metadata entries keyed by speech code (without 'r' prefix)
+    """
+    data = load_metadata_json(institution_dir)
+
+    # Add or update entries
+    data.update(entries)
 
     # Write updated JSON
-    with open(json_path, "w", encoding="utf-8") as f:
-        json.dump(data, f, indent=2, ensure_ascii=False)
+    write_metadata_json(institution_dir, data)
+
+
+def load_metadata_json(institution_dir: Path) -> Dict[str, Dict[str, Any]]:
+    """Load an institution's metadata.json file.
+
+    The parsed file is cached and reused for as long as its modification time
+    and size are unchanged.
+
+    Args:
+        institution_dir: Directory for the institution
+
+    Returns:
+        Metadata entries keyed by speech code (a copy the caller may modify),
+        empty if the file is missing or invalid
+    """
+    json_path = institution_dir / "metadata.json"
+    try:
+        st = json_path.stat()
+    except FileNotFoundError:
+        return {}
+
+    cached = _metadata_cache.get(json_path)
+    if cached is not None and cached[:2] == (st.st_mtime_ns, st.st_size):
+        return dict(cached[2])
+
+    try:
+        data: Dict[str, Dict[str, Any]] = load_json_file(json_path)
+    except ValueError:
+        logger.warning(f"Invalid JSON in {json_path}, creating new file")
+        return {}
+    _metadata_cache[json_path] = (st.st_mtime_ns, st.st_size, data)
+    return dict(data)
+
+
+def write_metadata_json(institution_dir: Path, data: Dict[str, Dict[str, Any]]) -> None:
+    """Write all entries of an institution's metadata.json file.
+
+    Args:
+        institution_dir: Directory for the institution
+        data: Metadata entries keyed by speech code
+    """
+    json_path = institution_dir / "metadata.json"
+    dump_json_file(json_path, data)
+
+    # What was just written is what the next load would parse
+    st = json_path.stat()
+    _metadata_cache[json_path] = (st.st_mtime_ns, st.st_size, dict(data))
+
+
+# Patterns used by parse_metadata_text, compiled once at import
+_SPEECH_TYPE_RE = re.compile(r"^\s*([A-Za-z]+(?:\s+[a-z]+)?)\s+(?:by|remarks)")
+_FULL_SPEAKER_RE = re.compile(
+    r"(?:by|remarks by)\s+([^,]+),\s+(.+?)(?:,\s+at|,\s+on|at|on|,\s+\d)"
+)
+_BASIC_SPEAKER_RE = re.compile(r"(?:by|remarks by)\s+([^,]+)")
+_ALT_TITLE_RE = re.compile(r"(?:\"|\")([^\"]+)(?:\"|\")")
+_FIELD_PATTERNS = (
+    # After "at"/"on" before comma/period/end
+    ("event", re.compile(r"(?:at|on)\s+the\s+(.+?)(?:,|\.|$)")),
+    # Date format like "3 May 2024"
+    ("speech_date", re.compile(r"(\d{1,2}\s+[A-Za-z]+\s+\d{4})")),
+)
+_US_LOCATION_RE = re.compile(r",\s+([^,]+,\s+[A-Za-z]+)(?:,\s+\d)")
+# Known locations in order of preference
+_SPECIFIC_LOCATIONS = (
+    "Washington DC",
+    "New York City",
+    "Frankfurt",
+    "London",
+    "Tokyo",
+    "Paris",
+    "Berlin",
+    "Basel",
+    "Zurich",
+)
+# All known locations in a single pattern, so the text is scanned once (no
+# location contains another, so every occurrence is found); make sure we
+# match whole words
+_SPECIFIC_LOCATION_RE = re.compile(
+    r"\b(" + "|".join(map(re.escape, _SPECIFIC_LOCATIONS)) + r")\b", re.IGNORECASE
+)
+_ORGANIZER_RE = re.compile(r"organised by\s+([^,]+)", re.IGNORECASE)
 
 
 def parse_metadata_text(metadata_text: str) -> Dict[str, str]:
@@ -192,20 +316,21 @@ def parse_metadata_text(metadata_text: str) -> Dict[str, str]:
     result = {}
 
     # First check if there's a speech title in quotes at the beginning
-    title_match = re.match(r"^\s*\"([^\"]+)\"", metadata_text)
+    # (plain string operations; this runs for every speech)
+    title = None
+    stripped_text = metadata_text.lstrip()
+    if stripped_text.startswith('"'):
+        title_end = stripped_text.find('"', 1)
+        if title_end > 1:
+            title = stripped_text[1:title_end]
 
     # Extract speech type from the beginning of the text
-    speech_type_match = re.match(
-        r"^\s*([A-Za-z]+(?:\s+[a-z]+)?)\s+(?:by|remarks)", metadata_text
-    )
+    speech_type_match = _SPEECH_TYPE_RE.match(metadata_text)
     if speech_type_match:
         result["speech_type"] = speech_type_match.group(1).strip()
 
     # Extract full speaker information
-    full_speaker_info = re.search(
-        r"(?:by|remarks by)\s+([^,]+),\s+(.+?)(?:,\s+at|,\s+on|at|on|,\s+\d)",
-        metadata_text,
-    )
+    full_speaker_info = _FULL_SPEAKER_RE.search(metadata_text)
 
     if full_speaker_info:
         # Just the name (Ms Name or Mr Name)
@@ -219,60 +344,49 @@ def parse_metadata_text(metadata_text: str) -> Dict[str, str]:
             result["role"] = role
     else:
         # Fallback for cases where the pattern doesn't match
-        basic_speaker_match = re.search(r"(?:by|remarks by)\s+([^,]+)", metadata_text)
+        basic_speaker_match = _BASIC_SPEAKER_RE.search(metadata_text)
         if basic_speaker_match:
             result["speaker"] = basic_speaker_match.group(1).strip()
 
-    # Other patterns
-    patterns = {
-        "event": r"(?:at|on)\s+the\s+(.+?)(?:,|\.|$)",  # After "at"/"on" before comma/period/end
-        "speech_date": r"(\d{1,2}\s+[A-Za-z]+\s+\d{4})",  # Date format like "3 May 2024"
-    }
-
     # Extract title if found
-    if title_match:
-        result["title"] = title_match.group(1).strip()
+    if title is not None:
+        result["title"] = title.strip()
     else:
         # Fallback title extraction
-        alt_title_match = re.search(r"(?:\"|\")([^\"]+)(?:\"|\")", metadata_text)
+        alt_title_match = _ALT_TITLE_RE.search(metadata_text)
         if alt_title_match:
             result["title"] = alt_title_match.group(1).strip()
 
     # Extract other fields using regex patterns
-    for field, pattern in patterns.items():
-        match = re.search(pattern, metadata_text)
+    date_index = -1
+    for field, pattern in _FIELD_PATTERNS:
+        match = pattern.search(metadata_text)
         if match:
             result[field] = match.group(1).strip()
+            if field == "speech_date":
+                date_index = match.start(1)
 
     # Location extraction - try multiple patterns
     # First look for common US location pattern: City, State before date
-    us_location_match = re.search(r",\s+([^,]+,\s+[A-Za-z]+)(?:,\s+\d)", metadata_text)
+    us_location_match = _US_LOCATION_RE.search(metadata_text)
     if us_location_match:
         result["location"] = us_location_match.group(1).strip()
 
     # If that didn't work, check for specific known locations
     elif not result.get("location"):
-        specific_locations = [
-            "Washington DC",
-            "New York City",
-            "Frankfurt",
-            "London",
-            "Tokyo",
-            "Paris",
-            "Berlin",
-            "Basel",
-            "Zurich",
-        ]
-        for loc in specific_locations:
-            # Make sure we match whole words
-            if re.search(rf"\b{re.escape(loc)}\b", metadata_text, re.IGNORECASE):
+        found = {
+            match.group(1).lower()
+            for match in _SPECIFIC_LOCATION_RE.finditer(metadata_text)
+        }
+        for loc in _SPECIFIC_LOCATIONS:
+            if loc.lower() in found:
                 result["location"] = loc
                 break
 
     # If still no location, try the fallback method
     if not result.get("location") and "speech_date" in result:
-        # Look for text between the last comma and the date
-        date_index = metadata_text.find(result["speech_date"])
+        # Look for text between the last comma and the date (whose position
+        # is already known from its match)
         if date_index > 0:
             text_before_date = metadata_text[:date_index].strip()
             last_comma = text_before_date.rfind(",")
@@ -284,9 +398,10 @@ def parse_metadata_text(metadata_text: str) -> Dict[str, str]:
                 # Extract the text between the second-last and last comma
                 location = text_before_date[second_last_comma + 1 : last_comma].strip()
                 # Don't capture "organized by" text
+                location_lower = location.lower()
                 if (
-                    "organised by" not in location.lower()
-                    and "organized by" not in location.lower()
+                    "organised by" not in location_lower
+                    and "organized by" not in location_lower
                 ):
                     result["location"] = location
 
@@ -298,7 +413,7 @@ def parse_metadata_text(metadata_text: str) -> Dict[str, str]:
             result["event"] = result["event"][4:]
 
     # Add organizer information if available
-    organizer_match = re.search(r"organised by\s+([^,]+)", metadata_text, re.IGNORECASE)
+    organizer_match = _ORGANIZER_RE.search(metadata_text)
     if organizer_match:
         result["organizer"] = organizer_match.group(1).strip()
 
@@ -0,0 +1,82 @@
+"""HTML utility functions for the BIS Scraper package.
+
+lxml is used when it is installed (``pip install bis_scraper[fast]``) and
+BeautifulSoup's built-in html.parser otherwise.
+"""
+
+import html as html_lib
+import re
+
+from bs4 import BeautifulSoup
+
+try:
+    import lxml.html  # type: ignore
+    from lxml import etree  # type: ignore
+
+    _HAS_LXML = True
+except ImportError:  # pragma: no cover - depends on the environment
+    _HAS_LXML = False
+
+# Element of a speech page that holds its metadata (speaker, event, date)
+METADATA_ELEMENT_ID = "extratitle-div"
+
+# The metadata element up to the first closing div tag, which is its own
+# closing tag as long as it contains no nested divs
+_METADATA_ELEMENT_RE = re.compile(
+    rf"""<div\b[^>]*\bid\s*=\s*["']{METADATA_ELEMENT_ID}["'][^>]*>(.*?)</div\s*>""",
+    re.DOTALL | re.IGNORECASE,
+)
+_TAG_RE = re.compile(r"<[^>]*>")
+
+
+def extract_metadata_text(html: str) -> str:
+    """Extract the metadata text from a speech page.
+
+    The metadata element is looked up with a regular expression first, which
+    avoids parsing the whole page; pages where that is not reliable (nested
+    divs or no match) are parsed as HTML.
+
+    Args:
+        html: HTML of the speech page
+
+    Returns:
+        Stripped text of the metadata element, or the text of the whole page
+        if the element is missing
+    """
+    match = _METADATA_ELEMENT_RE.search(html)
+    if match is not None:
+        content = match.group(1)
+        if "<div" not in content.lower():
+            return html_lib.unescape(_TAG_RE.sub("", content)).strip()
+
+    return _parse_metadata_text(html)
+
+
+def _parse_metadata_text(html: str) -> str:
+    """Extract the metadata text from a speech page with an HTML parser.
+
+    Args:
+        html: HTML of the speech page
+
+    Returns:
+        Stripped text of the metadata element, or the text of the whole page
+        if the element is missing
+    """
+    if _HAS_LXML:
+        try:
+            root = lxml.html.document_fromstring(html)
+        except (ValueError, etree.LxmlError):
+            # e.g. empty documents; let BeautifulSoup handle them
+            pass
+        else:
+            element = root.get_element_by_id(METADATA_ELEMENT_ID, None)
+            if element is not None:
+                return str(element.text_content()).strip()
+            return str(root.text_content())
+
+    soup = BeautifulSoup(html, "html.parser")
+    metadata_div = soup.find(id=METADATA_ELEMENT_ID)
+    if metadata_div:
+        return str(metadata_div.text).strip()
+    # Fall back to full text if the specific div isn't found
+    return str(soup.get_text())
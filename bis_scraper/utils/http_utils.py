@@ -0,0 +1,83 @@
+"""HTTP utility functions for the BIS Scraper package."""
+
+import threading
+import time
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from bis_scraper import __version__
+
+USER_AGENT = (
+    f"bis-scraper/{__version__} (+https://github.com/HanssonMagnus/bis-scraper)"
+)
+
+# Status codes that indicate a transient server-side problem worth retrying
+RETRY_STATUS_CODES = (429, 500, 502, 503, 504)
+
+
+def create_session(pool_maxsize: int = 10, retries: int = 3) -> requests.Session:
+    """Create a requests session with connection pooling and retries.
+
+    Reusing one session keeps TCP/TLS connections to the BIS server alive
+    across requests instead of opening a new connection for every call.
+
+    Args:
+        pool_maxsize: Maximum number of connections kept open per host
+        retries: Number of retries for connection errors and transient
+            server errors
+
+    Returns:
+        Configured requests session
+    """
+    retry = Retry(
+        total=retries,
+        backoff_factor=0.3,
+        status_forcelist=RETRY_STATUS_CODES,
+        # Hand the final response back to the caller (raise_for_status
+        # reports it) instead of raising urllib3's MaxRetryError
+        raise_on_status=False,
+    )
+    adapter = HTTPAdapter(
+        pool_connections=1, pool_maxsize=pool_maxsize, max_retries=retry
+    )
+
+    session = requests.Session()
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    session.headers["User-Agent"] = USER_AGENT
+    return session
+
+
+class RateLimiter:
+    """Space out requests so that at most one starts per interval.
+
+    The limiter is shared by all scraper threads: each call reserves the next
+    free time slot under a lock and then sleeps (outside the lock) until that
+    slot starts.
+    """
+
+    def __init__(self, min_interval: float) -> None:
+        """Initialize the rate limiter.
+
+        Args:
+            min_interval: Minimum number of seconds between the start of two
+                requests (0 disables rate limiting)
+        """
+        self.min_interval = min_interval
+        self._lock = threading.Lock()
+        self._next_slot = 0.0
+
+    def wait(self) -> None:
+        """Block until the caller may start its next request."""
+        if self.min_interval <= 0:
+            return
+
+        with self._lock:
+            now = time.monotonic()
+            delay = self._next_slot - now
+            self._next_slot = max(now, self._next_slot) + self.min_interval
+
+        if delay > 0:
+            time.sleep(delay)
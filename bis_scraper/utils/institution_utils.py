@@ -1,37 +1,75 @@
 """Institution utility functions for the BIS Scraper package."""
 
+import functools
+import hashlib
+import json
 import logging
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
 
 from bis_scraper.utils.constants import INSTITUTION_ALIASES, INSTITUTIONS
 
 logger = logging.getLogger(__name__)
 
 
+def _build_alias_map() -> Dict[str, str]:
+    """Map each lowercased alias to its standard institution name.
+
+    Returns:
+        Dictionary of aliases to standard names (for aliases listed under
+        several institutions, the first one in INSTITUTION_ALIASES wins)
+    """
+    alias_map: Dict[str, str] = {}
+    for standard_name, aliases in INSTITUTION_ALIASES.items():
+        for alias in aliases:
+            alias_map.setdefault(alias.lower(), standard_name)
+    return alias_map
+
+
+_ALIAS_TO_STANDARD = _build_alias_map()
+
+# Fingerprint of the institution mappings; it changes whenever INSTITUTIONS or
+# INSTITUTION_ALIASES change, so lookups that failed with older mappings are
+# known to be worth retrying
+INSTITUTION_MAP_VERSION = hashlib.sha256(
+    json.dumps([INSTITUTIONS, INSTITUTION_ALIASES], sort_keys=True).encode("utf-8")
+).hexdigest()[:16]
+
+# Lowercased patterns searched for in speech metadata, each with the standard
+# name it resolves to: institution names first, then aliases
+_METADATA_PATTERNS: Tuple[Tuple[str, str], ...] = tuple(
+    [
+        (inst.lower(), _ALIAS_TO_STANDARD.get(inst.lower(), inst.lower()))
+        for inst in INSTITUTIONS
+    ]
+    + [
+        (alias.lower(), standard_name)
+        for standard_name, aliases in INSTITUTION_ALIASES.items()
+        for alias in aliases
+    ]
+)
+
+
+# Characters replaced (spaces) or dropped (apostrophes, commas) when
+# normalizing institution names
+_NAME_TRANSLATION = str.maketrans({" ": "_", "'": None, ",": None})
+
+
+@functools.lru_cache(maxsize=1024)
 def normalize_institution_name(institution: str) -> str:
     """Normalize institution name to a standard format.
 
+    Results are memoized, as the same few hundred names are normalized
+    repeatedly while scraping and converting.
+
     Args:
         institution: Institution name to normalize
 
     Returns:
         Normalized institution name with spaces converted to underscores and lowercase
     """
-    # Convert to lowercase for case-insensitive matching
-    normalized = institution.lower()
-
-    # Strip whitespace from the ends
-    normalized = normalized.strip()
-
-    # Replace spaces with underscores
-    normalized = normalized.replace(" ", "_")
-
-    # Replace special characters
-    normalized = normalized.replace("'", "")
-    normalized = normalized.replace(",", "")
-    normalized = normalized.replace("&", "and")
-
-    return normalized
+    # Lowercase and strip, then spell out "&" and map spaces and punctuation
+    # in a single translate pass
+    return institution.lower().strip().replace("&", "and").translate(_NAME_TRANSLATION)
 
 
 def standardize_institution_name(institution: str) -> str:
@@ -45,13 +83,8 @@ def standardize_institution_name(institution: str) -> str:
     """
     institution_lower = institution.lower()
 
-    # Check if this is an alias
-    for standard_name, aliases in INSTITUTION_ALIASES.items():
-        if institution_lower in [alias.lower() for alias in aliases]:
-            return standard_name
-
-    # If not an alias, return the original (but lowercase)
-    return institution_lower
+    # Map aliases to their standard name, otherwise return the original (but lowercase)
+    return _ALIAS_TO_STANDARD.get(institution_lower, institution_lower)
 
 
 def get_institution_from_metadata(metadata: str) -> Optional[str]:
@@ -69,16 +102,10 @@ def get_institution_from_metadata(metadata: str) -> Optional[str]:
     # Convert to lowercase for case-insensitive matching
     metadata_lower = metadata.lower()
 
-    # First try direct matching of institution names
-    for institution in INSTITUTIONS:
-        if institution.lower() in metadata_lower:
-            return standardize_institution_name(institution)
-
-    # Then try matching aliases
-    for standard_name, aliases in INSTITUTION_ALIASES.items():
-        for alias in aliases:
-            if alias.lower() in metadata_lower:
-                return standard_name
+    # Patterns are checked in priority order, so the first match wins
+    for pattern, standard_name in _METADATA_PATTERNS:
+        if pattern in metadata_lower:
+            return standard_name
 
     logger.warning(f"No institution found in metadata: {metadata}")
     return None
@@ -0,0 +1,152 @@
+"""JSON utility functions for the BIS Scraper package.
+
+orjson is used when it is installed (``pip install bis_scraper[fast]``) and
+the standard library json module otherwise.
+"""
+
+import os
+from pathlib import Path
+from typing import Any, Iterable, List
+
+try:
+    import orjson  # type: ignore[import-not-found]
+
+    _loads = orjson.loads
+
+    def _dumps(data: Any) -> bytes:
+        content: bytes = orjson.dumps(data, option=orjson.OPT_INDENT_2)
+        return content
+
+    def _dumps_line(data: Any) -> bytes:
+        content: bytes = orjson.dumps(data)
+        return content
+
+except ImportError:  # pragma: no cover - depends on the environment
+    import json
+
+    _loads = json.loads  # type: ignore[assignment]
+
+    def _dumps(data: Any) -> bytes:
+        return json.dumps(data, indent=2, ensure_ascii=False).encode("utf-8")
+
+    def _dumps_line(data: Any) -> bytes:
+        return json.dumps(data, ensure_ascii=False, separators=(",", ":")).encode(
+            "utf-8"
+        )
+
+
+# fdatasync skips flushing unrelated inode metadata, but is not available
+# on every platform (e.g. macOS and Windows)
+_fdatasync = getattr(os, "fdatasync", os.fsync)
+
+
+def _write_all(fd: int, content: bytes) -> None:
+    """Write all of content to a file descriptor.
+
+    Args:
+        fd: Open file descriptor
+        content: Bytes to write
+    """
+    view = memoryview(content)
+    while view:
+        view = view[os.write(fd, view) :]
+
+
+def load_json_file(path: Path) -> Any:
+    """Read and parse a UTF-8 encoded JSON file.
+
+    Args:
+        path: Path to the JSON file
+
+    Returns:
+        Parsed JSON data
+
+    Raises:
+        OSError: If the file cannot be read
+        ValueError: If the file does not contain valid JSON
+    """
+    return _loads(path.read_bytes())
+
+
+def dump_json_file(path: Path, data: Any) -> None:
+    """Atomically write data to a UTF-8 encoded JSON file indented by two spaces.
+
+    The data is written to a temporary file next to the target, synced to
+    disk and then renamed over the target, so readers (and a crash) only ever
+    see the old or the new complete file.
+
+    Args:
+        path: Path to the JSON file
+        data: JSON-serializable data
+
+    Raises:
+        OSError: If the file cannot be written
+        TypeError: If the data is not JSON-serializable
+    """
+    content = _dumps(data)
+    tmp_path = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+
+    fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o666)
+    try:
+        try:
+            _write_all(fd, content)
+            # Only the data needs to be durable before the rename
+            _fdatasync(fd)
+        finally:
+            os.close(fd)
+        os.replace(tmp_path, path)
+    except BaseException:
+        tmp_path.unlink(missing_ok=True)
+        raise
+
+
+def load_json_lines(path: Path) -> List[Any]:
+    """Read and parse a UTF-8 encoded file with one JSON value per line.
+
+    Lines that are not valid JSON, such as a last line cut short by a crash
+    while it was being appended, are skipped.
+
+    Args:
+        path: Path to the JSON lines file
+
+    Returns:
+        Parsed values in file order
+
+    Raises:
+        OSError: If the file cannot be read
+    """
+    records = []
+    for line in path.read_bytes().splitlines():
+        if not line.strip():
+            continue
+        try:
+            records.append(_loads(line))
+        except ValueError:
+            continue
+    return records
+
+
+def append_json_lines(path: Path, records: Iterable[Any]) -> None:
+    """Append values to a UTF-8 encoded file, one compact JSON value per line.
+
+    The lines are written with a single append and synced to disk, so the
+    cost does not grow with the size of the file.
+
+    Args:
+        path: Path to the JSON lines file (created if missing)
+        records: JSON-serializable values
+
+    Raises:
+        OSError: If the file cannot be written
+        TypeError: If a value is not JSON-serializable
+    """
+    content = b"".join(_dumps_line(record) + b"\n" for record in records)
+    if not content:
+        return
+
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_APPEND, 0o666)
+    try:
+        _write_all(fd, content)
+        _fdatasync(fd)
+    finally:
+        os.close(fd)
@@ -0,0 +1 @@
+"""Tests for the BIS Scraper package."""
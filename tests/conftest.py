@@ -1,6 +1,5 @@
 """Test fixtures and configuration for the BIS Scraper package."""
 
-import shutil
 from pathlib import Path
 from typing import Generator
 
@@ -27,11 +26,8 @@ def test_data_dir(tmp_path: Path) -> Path:
     (data_dir / RAW_DATA_DIR).mkdir(exist_ok=True)
     (data_dir / TXT_DATA_DIR).mkdir(exist_ok=True)
 
-    yield data_dir
-
-    # Clean up after test
-    if data_dir.exists():
-        shutil.rmtree(data_dir)
+    # pytest removes tmp_path itself, so no teardown is needed
+    return data_dir
 
 
 @pytest.fixture
@@ -40,11 +36,7 @@ def test_log_dir(tmp_path: Path) -> Path:
     log_dir = tmp_path / "logs"
     log_dir.mkdir(exist_ok=True)
 
-    yield log_dir
-
-    # Clean up after test
-    if log_dir.exists():
-        shutil.rmtree(log_dir)
+    return log_dir
 
 
 @pytest.fixture
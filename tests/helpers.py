@@ -0,0 +1,22 @@
+"""Shared helpers for the BIS Scraper tests."""
+
+import re
+
+import responses
+
+from bis_scraper.utils.constants import HTML_EXTENSION, SPEECHES_URL
+
+
+def mock_letters_not_found(letters: str = "b-z") -> None:
+    """Mock 404 responses for the 2020-01-01 speech pages of the given letters.
+
+    Args:
+        letters: Regular expression character range of the speech letters
+    """
+    responses.add(
+        responses.GET,
+        re.compile(
+            rf"{re.escape(SPEECHES_URL)}/r200101[{letters}]{re.escape(HTML_EXTENSION)}"
+        ),
+        status=404,
+    )
@@ -12,6 +12,7 @@ import responses
 from bis_scraper.converters.controller import convert_pdfs_dates
 from bis_scraper.scrapers.controller import scrape_bis
 from bis_scraper.utils.constants import HTML_EXTENSION, PDF_EXTENSION, SPEECHES_URL
+from tests.helpers import mock_letters_not_found
 
 
 class TestCompleteWorkflow(unittest.TestCase):
@@ -21,6 +22,7 @@ class TestCompleteWorkflow(unittest.TestCase):
         """Set up test fixtures."""
         # Create temporary directories
         self.temp_dir = Path(tempfile.mkdtemp())
+
         # Use the actual directory names from constants
         from bis_scraper.utils.constants import RAW_DATA_DIR, TXT_DATA_DIR
 
@@ -76,9 +78,7 @@ class TestCompleteWorkflow(unittest.TestCase):
 
         # Mock 404 for all other letters to stop the loop
         # Use a consistent approach with what we're doing in test_bis_scraper.py
-        for letter in "bcdefghijklmnopqrstuvwxyz":
-            url = f"{SPEECHES_URL}/r200101{letter}{HTML_EXTENSION}"
-            responses.add(responses.GET, url, status=404)
+        mock_letters_not_found()
 
         # Prepare dates for scraping
         start_date = self.test_date
@@ -92,6 +92,7 @@ class TestCompleteWorkflow(unittest.TestCase):
             end_date=end_date,
             institutions=None,  # Use no institution filter to match all institutions
             force=False,
+            request_interval=0,
         )
 
         # Verify scraping results
@@ -115,6 +116,8 @@ class TestCompleteWorkflow(unittest.TestCase):
             end_date=self.test_date,
             institutions=[self.institution],
             force=False,
+            workers=1,
+            backend="textract",
         )
 
         # Verify conversion results
@@ -162,9 +165,7 @@ class TestCompleteWorkflow(unittest.TestCase):
         )
 
         # Mock 404 for other letters to avoid potential issues
-        for letter in "bcdefghijklmnopqrstuvwxyz":
-            url = f"{SPEECHES_URL}/r200101{letter}{HTML_EXTENSION}"
-            responses.add(responses.GET, url, status=404)
+        mock_letters_not_found()
 
         # Run scraping - it should skip the existing file
         scrape_result = scrape_bis(
@@ -174,6 +175,7 @@ class TestCompleteWorkflow(unittest.TestCase):
             end_date=self.test_date,
             institutions=[self.institution],
             force=False,
+            request_interval=0,
         )
 
         # Verify it was skipped
@@ -195,6 +197,8 @@ class TestCompleteWorkflow(unittest.TestCase):
             end_date=self.test_date,
             institutions=[self.institution],
             force=False,
+            workers=1,
+            backend="textract",
         )
 
         # Verify it was skipped
@@ -237,6 +241,7 @@ class TestCompleteWorkflow(unittest.TestCase):
             end_date=self.test_date,
             institutions=None,  # Use no institution filter to match all institutions
             force=True,
+            request_interval=0,
         )
 
         # Verify it was downloaded
@@ -255,6 +260,8 @@ class TestCompleteWorkflow(unittest.TestCase):
             end_date=self.test_date,
             institutions=[self.institution],
             force=True,
+            workers=1,
+            backend="textract",
         )
 
         # Verify it was converted
@@ -265,6 +272,51 @@ class TestCompleteWorkflow(unittest.TestCase):
             content = f.read()
         self.assertEqual(content, "New converted content")
 
+    @responses.activate
+    def test_concurrent_scrape_respects_limit(self) -> None:
+        """Test that scraping dates concurrently stops at the download limit."""
+        html_content = """
+        <div id="extratitle-div">
+            Speech by Mr. John Smith, Governor of the European Central Bank
+        </div>
+        """
+        dates = [self.test_date + datetime.timedelta(days=i) for i in range(6)]
+        for date_obj in dates:
+            date_str = date_obj.strftime("%y%m%d")
+            responses.add(
+                responses.GET,
+                f"{SPEECHES_URL}/r{date_str}a{HTML_EXTENSION}",
+                body=html_content,
+                status=200,
+            )
+            responses.add(
+                responses.GET,
+                f"{SPEECHES_URL}/r{date_str}a{PDF_EXTENSION}",
+                body=b"%PDF-1.4\nTest PDF content",
+                status=200,
+            )
+            responses.add(
+                responses.GET,
+                f"{SPEECHES_URL}/r{date_str}b{HTML_EXTENSION}",
+                status=404,
+            )
+
+        scrape_result = scrape_bis(
+            data_dir=self.temp_dir,
+            log_dir=self.log_dir,
+            start_date=dates[0],
+            end_date=dates[-1],
+            limit=3,
+            workers=4,
+            request_interval=0,
+        )
+
+        # Exactly the limit is downloaded even though dates run in parallel
+        self.assertEqual(scrape_result.downloaded, 3)
+        self.assertEqual(scrape_result.failed, 0)
+        ecb_dir = self.raw_dir / "european_central_bank"
+        self.assertEqual(len(list(ecb_dir.glob("*.pdf"))), 3)
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -1,7 +1,9 @@
 """Tests for the command line interface."""
 
+import sys
+import tempfile
 import unittest
-from unittest.mock import patch
+from unittest.mock import MagicMock, patch
 
 from click.testing import CliRunner
 
@@ -40,6 +42,11 @@ class TestCli(unittest.TestCase):
         self.assertIn("Starting BIS web scraping", result.output)
         self.assertIn("Scraping completed", result.output)
 
+        # The request interval is passed through to the scraper
+        result = self.runner.invoke(main, ["scrape", "--request-interval", "1.5"])
+        self.assertEqual(result.exit_code, 0, result.output)
+        self.assertEqual(mock_scrape_bis.call_args.kwargs["request_interval"], 1.5)
+
     @patch("bis_scraper.converters.controller.convert_pdfs_dates")
     def test_convert_command(self, mock_convert) -> None:
         """Test the convert command."""
@@ -67,6 +74,101 @@ class TestCli(unittest.TestCase):
         self.assertIn("Starting PDF to text conversion", result.output)
         self.assertIn("Conversion completed", result.output)
 
+    @patch("bis_scraper.converters.controller.convert_pdfs_dates")
+    @patch(
+        "bis_scraper.scrapers.recategorize.recategorize_unknown_files",
+        return_value=(0, 0),
+    )
+    @patch("bis_scraper.scrapers.controller.scrape_bis")
+    def test_run_all_command(
+        self, mock_scrape_bis, mock_recategorize, mock_convert
+    ) -> None:
+        """Test the run-all command without an explicit date range."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            result = self.runner.invoke(
+                main,
+                [
+                    "-d",
+                    temp_dir,
+                    "-l",
+                    temp_dir,
+                    "run-all",
+                    "--workers",
+                    "2",
+                    "--request-interval",
+                    "0.5",
+                ],
+            )
+
+        self.assertEqual(result.exit_code, 0, result.output)
+        self.assertIn("Scraping completed", result.output)
+        self.assertIn("Re-categorization completed", result.output)
+        self.assertIn("Conversion completed", result.output)
+
+        # Scraping falls back to the default date range
+        scrape_kwargs = mock_scrape_bis.call_args.kwargs
+        self.assertIsNotNone(scrape_kwargs["start_date"])
+        self.assertIsNotNone(scrape_kwargs["end_date"])
+
+        # The request interval applies to scraping and re-categorization
+        self.assertEqual(scrape_kwargs["request_interval"], 0.5)
+        self.assertEqual(mock_recategorize.call_args.kwargs["request_interval"], 0.5)
+
+        # Conversion is not restricted to a date range
+        convert_kwargs = mock_convert.call_args.kwargs
+        self.assertIsNone(convert_kwargs["start_date"])
+        self.assertEqual(convert_kwargs["workers"], 2)
+
+    def test_invalid_log_buffer_size(self) -> None:
+        """Test that a non-positive log buffer size is rejected."""
+        result = self.runner.invoke(main, ["--log-buffer-size", "0", "scrape"])
+
+        self.assertEqual(result.exit_code, 2)
+        self.assertIn("--log-buffer-size", result.output)
+
+    @patch("bis_scraper.scrapers.controller.scrape_bis")
+    def test_http_cache_option(self, mock_scrape_bis) -> None:
+        """Test that --http-cache installs the HTTP response cache."""
+        # requests-cache is an optional extra, so a stub stands in for it
+        requests_cache = MagicMock()
+        with patch.dict(sys.modules, {"requests_cache": requests_cache}):
+            with tempfile.TemporaryDirectory() as temp_dir:
+                result = self.runner.invoke(
+                    main, ["-d", temp_dir, "-l", temp_dir, "--http-cache", "scrape"]
+                )
+
+        self.assertEqual(result.exit_code, 0)
+        requests_cache.install_cache.assert_called_once()
+        cache_name = requests_cache.install_cache.call_args.args[0]
+        self.assertTrue(cache_name.endswith(".http_cache"))
+
+    @patch("bis_scraper.scrapers.controller.scrape_bis")
+    def test_http_cache_disabled_by_default(self, mock_scrape_bis) -> None:
+        """Test that no HTTP response cache is installed by default."""
+        requests_cache = MagicMock()
+        with patch.dict(sys.modules, {"requests_cache": requests_cache}):
+            with tempfile.TemporaryDirectory() as temp_dir:
+                result = self.runner.invoke(
+                    main, ["-d", temp_dir, "-l", temp_dir, "scrape"]
+                )
+
+        self.assertEqual(result.exit_code, 0)
+        requests_cache.install_cache.assert_not_called()
+
+    @patch("bis_scraper.scrapers.controller.scrape_bis")
+    def test_http_cache_without_requests_cache(self, mock_scrape_bis) -> None:
+        """Test that --http-cache is rejected when requests-cache is missing."""
+        # A None entry in sys.modules makes the import raise ImportError
+        with patch.dict(sys.modules, {"requests_cache": None}):
+            with tempfile.TemporaryDirectory() as temp_dir:
+                result = self.runner.invoke(
+                    main, ["-d", temp_dir, "-l", temp_dir, "--http-cache", "scrape"]
+                )
+
+        self.assertEqual(result.exit_code, 2)
+        self.assertIn("requires requests-cache", result.output)
+        mock_scrape_bis.assert_not_called()
+
 
 if __name__ == "__main__":
     unittest.main()
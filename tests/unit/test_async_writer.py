@@ -0,0 +1,140 @@
+"""Unit tests for the background metadata writer."""
+
+import json
+import tempfile
+import threading
+import unittest
+from pathlib import Path
+from typing import Any, Dict
+from unittest.mock import patch
+
+from bis_scraper.utils.async_writer import AsyncMetadataWriter
+
+
+class TestAsyncMetadataWriter(unittest.TestCase):
+    """Test AsyncMetadataWriter."""
+
+    def setUp(self) -> None:
+        """Set up test fixtures."""
+        self.temp_dir = Path(tempfile.mkdtemp())
+        self.writer = AsyncMetadataWriter()
+
+    def tearDown(self) -> None:
+        """Tear down test fixtures."""
+        import shutil
+
+        self.writer.close()
+        if self.temp_dir.exists():
+            shutil.rmtree(self.temp_dir)
+
+    def _load(self) -> Dict[str, Any]:
+        """Load the metadata.json file written by the writer."""
+        with open(self.temp_dir / "metadata.json", "r", encoding="utf-8") as f:
+            data: Dict[str, Any] = json.load(f)
+        return data
+
+    def test_flush_merges_with_existing_file(self) -> None:
+        """Test that queued entries are added to an existing metadata.json."""
+        with open(self.temp_dir / "metadata.json", "w", encoding="utf-8") as f:
+            json.dump({"200101a": {"raw_text": "Old"}}, f)
+
+        self.writer.submit(self.temp_dir, "200102a", {"raw_text": "New"})
+        self.writer.flush()
+
+        data = self._load()
+        self.assertEqual(data["200101a"], {"raw_text": "Old"})
+        self.assertEqual(data["200102a"], {"raw_text": "New"})
+
+    def test_entries_written_on_flush(self) -> None:
+        """Test that entries are kept in memory until the writer is flushed."""
+        self.writer.submit(self.temp_dir, "200101a", {"raw_text": "First"})
+        self.writer.flush()
+        self.writer.submit(self.temp_dir, "200101b", {"raw_text": "Second"})
+
+        self.assertEqual(list(self._load()), ["200101a"])
+        self.writer.flush()
+        self.assertEqual(list(self._load()), ["200101a", "200101b"])
+
+    def test_concurrent_submits(self) -> None:
+        """Test that entries submitted from several threads are all kept."""
+
+        def submit_range(start: int) -> None:
+            for i in range(start, start + 25):
+                self.writer.submit(self.temp_dir, f"code{i}", {"raw_text": str(i)})
+
+        threads = [
+            threading.Thread(target=submit_range, args=(n * 25,)) for n in range(4)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.writer.flush()
+
+        self.assertEqual(len(self._load()), 100)
+
+    def test_unchanged_entries_not_rewritten(self) -> None:
+        """Test that resubmitting an identical entry does not rewrite the file."""
+        entry = {"raw_text": "Speech", "date": "2020-01-01"}
+        with open(self.temp_dir / "metadata.json", "w", encoding="utf-8") as f:
+            json.dump({"200101a": entry}, f)
+
+        with patch("bis_scraper.utils.async_writer.write_metadata_json") as mock_write:
+            self.writer.submit(self.temp_dir, "200101a", dict(entry))
+            self.writer.flush()
+            mock_write.assert_not_called()
+
+            self.writer.submit(self.temp_dir, "200101a", {"raw_text": "Changed"})
+            self.writer.flush()
+            mock_write.assert_called_once()
+
+    def test_failed_entry_does_not_stop_writer(self) -> None:
+        """Test that an error applying one entry does not block later flushes."""
+        with patch(
+            "bis_scraper.utils.async_writer.load_metadata_json",
+            side_effect=[OSError("Disk error"), {}],
+        ):
+            self.writer.submit(self.temp_dir, "200101a", {"raw_text": "Lost"})
+            self.writer.flush()
+            self.writer.submit(self.temp_dir, "200101b", {"raw_text": "Kept"})
+            self.writer.flush()
+
+        self.assertEqual(self._load(), {"200101b": {"raw_text": "Kept"}})
+
+    def test_failed_write_retried_on_next_flush(self) -> None:
+        """Test that a metadata file that failed to write is written later."""
+        with patch(
+            "bis_scraper.utils.async_writer.write_metadata_json",
+            side_effect=OSError("Disk full"),
+        ):
+            self.writer.submit(self.temp_dir, "200101a", {"raw_text": "Speech"})
+            self.writer.flush()
+
+        # No new entry arrives for the institution, yet the file is written
+        self.writer.flush()
+
+        self.assertEqual(self._load(), {"200101a": {"raw_text": "Speech"}})
+
+    def test_flush_raises_if_thread_stopped(self) -> None:
+        """Test that flush() raises instead of hanging when the thread is gone."""
+        # Stop the thread behind the writer's back
+        self.writer._queue.put(None)
+        self.writer._thread.join()
+
+        with self.assertRaises(RuntimeError):
+            self.writer.flush()
+        with self.assertRaises(RuntimeError):
+            self.writer.close()
+
+    def test_close_writes_pending_entries(self) -> None:
+        """Test that closing the writer writes queued entries first."""
+        self.writer.submit(self.temp_dir, "200101a", {"raw_text": "Speech"})
+        self.writer.close()
+
+        self.assertIn("200101a", self._load())
+        with self.assertRaises(RuntimeError):
+            self.writer.submit(self.temp_dir, "200101b", {"raw_text": "Late"})
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -4,11 +4,14 @@ import datetime
 import tempfile
 import unittest
 from pathlib import Path
+from typing import BinaryIO
+from unittest.mock import patch
 
 import responses
 
 from bis_scraper.scrapers.bis_scraper import BisScraper
 from bis_scraper.utils.constants import HTML_EXTENSION, PDF_EXTENSION, SPEECHES_URL
+from tests.helpers import mock_letters_not_found
 
 
 class TestBisScraper(unittest.TestCase):
@@ -67,6 +70,7 @@ class TestBisScraper(unittest.TestCase):
             output_dir=self.temp_dir,
             institutions=None,  # All institutions
             force_download=False,
+            request_interval=0,
         )
 
         # Scrape date
@@ -82,6 +86,7 @@ class TestBisScraper(unittest.TestCase):
         ecb_dir = self.temp_dir / "european_central_bank"
         self.assertTrue(ecb_dir.exists())
         self.assertTrue((ecb_dir / f"{self.speech_code_without_r}.pdf").exists())
+        self.assertEqual(list(ecb_dir.glob("*.part")), [])
 
         # Check JSON metadata file
         json_metadata_file = ecb_dir / "metadata.json"
@@ -102,17 +107,14 @@ class TestBisScraper(unittest.TestCase):
             f.write(b"Existing content")
 
         # We need to mock all possible letter responses
-        for letter in "abcdefghijklmnopqrstuvwxyz":
-            # Mock 404 responses for all letter codes
-            responses.add(
-                responses.GET,
-                f"{SPEECHES_URL}/r200101{letter}{HTML_EXTENSION}",
-                status=404,
-            )
+        mock_letters_not_found("a-z")
 
         # Initialize scraper with cache building enabled
         scraper = BisScraper(
-            output_dir=self.temp_dir, institutions=None, force_download=False
+            output_dir=self.temp_dir,
+            institutions=None,
+            force_download=False,
+            request_interval=0,
         )
 
         # Scrape date - should skip due to existing file
@@ -129,6 +131,32 @@ class TestBisScraper(unittest.TestCase):
             content = f.read()
         self.assertEqual(content, b"Existing content")
 
+    @responses.activate
+    def test_cached_letters_are_not_requested(self) -> None:
+        """Test that only letters without a cached file are requested."""
+        ecb_dir = self.temp_dir / "european_central_bank"
+        ecb_dir.mkdir(parents=True)
+        for code in ("200101a", "200101b"):
+            (ecb_dir / f"{code}.pdf").write_bytes(b"Existing content")
+
+        responses.add(
+            responses.GET, f"{SPEECHES_URL}/r200101c{HTML_EXTENSION}", status=404
+        )
+
+        scraper = BisScraper(
+            output_dir=self.temp_dir,
+            institutions=None,
+            force_download=False,
+            request_interval=0,
+        )
+        scraper.scrape_date(self.test_date)
+
+        result = scraper.get_results()
+        self.assertEqual(result.skipped, 2)
+        self.assertEqual(result.failed, 0)
+        # Only the first uncached letter was fetched
+        self.assertEqual(len(responses.calls), 1)
+
     @responses.activate
     def test_force_download(self) -> None:
         """Test force downloading existing files."""
@@ -164,7 +192,10 @@ class TestBisScraper(unittest.TestCase):
 
         # Initialize scraper with force_download=True
         scraper = BisScraper(
-            output_dir=self.temp_dir, institutions=None, force_download=True
+            output_dir=self.temp_dir,
+            institutions=None,
+            force_download=True,
+            request_interval=0,
         )
 
         # Scrape date - should re-download
@@ -197,12 +228,7 @@ class TestBisScraper(unittest.TestCase):
         </html>
         """
         # Mock 404 for all other letters to stop the loop
-        for letter in "bcdefghijklmnopqrstuvwxyz":
-            responses.add(
-                responses.GET,
-                f"{SPEECHES_URL}/r200101{letter}{HTML_EXTENSION}",
-                status=404,
-            )
+        mock_letters_not_found()
 
         # Test with Federal Reserve filter (will exclude ECB)
         # First reset all responses to ensure clean slate
@@ -212,18 +238,14 @@ class TestBisScraper(unittest.TestCase):
         responses.add(responses.GET, self.metadata_url, body=html_content, status=200)
 
         # Mock 404 for all other letters
-        for letter in "bcdefghijklmnopqrstuvwxyz":
-            responses.add(
-                responses.GET,
-                f"{SPEECHES_URL}/r200101{letter}{HTML_EXTENSION}",
-                status=404,
-            )
+        mock_letters_not_found()
 
         # Initialize scraper with Federal Reserve filter (will exclude ECB)
         scraper = BisScraper(
             output_dir=self.temp_dir,
             institutions=["Federal Reserve"],
             force_download=False,
+            request_interval=0,
         )
 
         # Scrape date - should skip due to institution filter
@@ -247,18 +269,14 @@ class TestBisScraper(unittest.TestCase):
         responses.add(responses.GET, self.pdf_url, body=pdf_content, status=200)
 
         # Mock 404 for next letter to stop the loop
-        for letter in "bcdefghijklmnopqrstuvwxyz":
-            responses.add(
-                responses.GET,
-                f"{SPEECHES_URL}/r200101{letter}{HTML_EXTENSION}",
-                status=404,
-            )
+        mock_letters_not_found()
 
         # Initialize scraper with ECB filter (will include ECB)
         scraper = BisScraper(
             output_dir=self.temp_dir,
             institutions=["European Central Bank"],
             force_download=False,
+            request_interval=0,
         )
 
         # Scrape date - should download
@@ -279,16 +297,14 @@ class TestBisScraper(unittest.TestCase):
         responses.add(responses.GET, self.metadata_url, status=500)  # Server error
 
         # Mock 404 for all other letters to stop the loop
-        for letter in "bcdefghijklmnopqrstuvwxyz":
-            responses.add(
-                responses.GET,
-                f"{SPEECHES_URL}/r200101{letter}{HTML_EXTENSION}",
-                status=404,
-            )
+        mock_letters_not_found()
 
         # Initialize scraper
         scraper = BisScraper(
-            output_dir=self.temp_dir, institutions=None, force_download=False
+            output_dir=self.temp_dir,
+            institutions=None,
+            force_download=False,
+            request_interval=0,
         )
 
         # Scrape date - should handle error
@@ -300,6 +316,46 @@ class TestBisScraper(unittest.TestCase):
         self.assertEqual(result.skipped, 0)
         self.assertEqual(result.failed, 1)  # Failed due to server error
 
+    @responses.activate
+    def test_interrupted_download_removes_partial_file(self) -> None:
+        """Test that a download failing mid-stream leaves no partial PDF."""
+        html_content = """
+        <div id="extratitle-div">
+            Speech by Mr. John Smith, Governor of the European Central Bank
+        </div>
+        """
+        responses.add(responses.GET, self.metadata_url, body=html_content, status=200)
+        responses.add(
+            responses.GET, self.pdf_url, body=b"%PDF-1.4\nTest PDF", status=200
+        )
+        responses.add(
+            responses.GET, f"{SPEECHES_URL}/r200101b{HTML_EXTENSION}", status=404
+        )
+
+        def fail_midway(src: BinaryIO, dst: BinaryIO, length: int) -> None:
+            dst.write(b"%PDF-1.4\n")
+            raise OSError("Connection reset")
+
+        scraper = BisScraper(
+            output_dir=self.temp_dir,
+            institutions=None,
+            force_download=False,
+            request_interval=0,
+        )
+        with patch("shutil.copyfileobj", side_effect=fail_midway):
+            scraper.scrape_date(self.test_date)
+
+        result = scraper.get_results()
+        self.assertEqual(result.downloaded, 0)
+        self.assertEqual(result.failed, 1)
+        pdf_path = (
+            self.temp_dir
+            / "european_central_bank"
+            / f"{self.speech_code_without_r}.pdf"
+        )
+        self.assertFalse(pdf_path.exists())
+        self.assertFalse(pdf_path.with_suffix(".part").exists())
+
 
 if __name__ == "__main__":
     unittest.main()
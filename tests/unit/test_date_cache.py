@@ -16,10 +16,11 @@ class TestDateCache:
         output_dir = tmp_path / "output"
         output_dir.mkdir()
 
-        scraper = BisScraper(output_dir)
+        scraper = BisScraper(output_dir, request_interval=0)
 
         assert scraper.date_cache_file == output_dir / ".bis_scraper_date_cache.json"
         assert scraper.checked_dates == {}
+        scraper.close()
 
     def test_date_cache_load_existing(self, tmp_path: Path) -> None:
         """Test loading an existing date cache."""
@@ -43,18 +44,19 @@ class TestDateCache:
         with open(cache_file, "w") as f:
             json.dump(cache_data, f)
 
-        scraper = BisScraper(output_dir)
+        scraper = BisScraper(output_dir, request_interval=0)
 
         assert "2023-01-01" in scraper.checked_dates
         assert scraper.checked_dates["2023-01-01"]["had_speeches"] is True
         assert scraper.checked_dates["2023-01-01"]["files_found"] == 2
+        scraper.close()
 
     def test_date_cache_save(self, tmp_path: Path) -> None:
         """Test saving the date cache."""
         output_dir = tmp_path / "output"
         output_dir.mkdir()
 
-        scraper = BisScraper(output_dir)
+        scraper = BisScraper(output_dir, request_interval=0)
 
         # Add some dates to the cache
         scraper.checked_dates["2023-01-01"] = {
@@ -75,36 +77,78 @@ class TestDateCache:
         assert saved_data["version"] == 1
         assert "2023-01-01" in saved_data["dates"]
         assert saved_data["dates"]["2023-01-01"]["had_speeches"] is False
+        scraper.close()
+
+    @patch("requests.Session.get")
+    def test_periodic_saves_append_to_journal(
+        self, mock_get: MagicMock, tmp_path: Path
+    ) -> None:
+        """Test that periodic saves append to the journal and results compact it."""
+        output_dir = tmp_path / "output"
+        output_dir.mkdir()
+
+        # Mock a 404 response (no speeches on any date)
+        mock_response = MagicMock()
+        mock_response.status_code = 404
+        mock_get.return_value = mock_response
+
+        scraper = BisScraper(output_dir, request_interval=0)
+        for day in range(1, 13):
+            scraper.scrape_date(datetime.date(2023, 1, day))
+
+        # The first 10 dates were appended without writing the snapshot
+        assert not scraper.date_cache_file.exists()
+        journal_lines = scraper.date_cache_journal_file.read_text().splitlines()
+        assert len(journal_lines) == 10
+
+        # A new scraper replays the journal
+        replayed = BisScraper(output_dir, request_interval=0)
+        assert len(replayed.checked_dates) == 10
+        replayed.close()
+
+        # The final save writes every date to the snapshot and removes the journal
+        scraper.get_results()
+        assert not scraper.date_cache_journal_file.exists()
+        with open(scraper.date_cache_file, "r") as f:
+            assert len(json.load(f)["dates"]) == 12
+        reloaded = BisScraper(output_dir, request_interval=0)
+        assert len(reloaded.checked_dates) == 12
+        reloaded.close()
+        scraper.close()
 
     def test_get_date_cache_key_no_institutions(self, tmp_path: Path) -> None:
         """Test cache key generation without institution filtering."""
         output_dir = tmp_path / "output"
         output_dir.mkdir()
 
-        scraper = BisScraper(output_dir)
+        scraper = BisScraper(output_dir, request_interval=0)
         date_obj = datetime.date(2023, 1, 1)
 
         key = scraper._get_date_cache_key(date_obj)
         assert key == "2023-01-01"
+        scraper.close()
 
     def test_get_date_cache_key_with_institutions(self, tmp_path: Path) -> None:
         """Test cache key generation with institution filtering."""
         output_dir = tmp_path / "output"
         output_dir.mkdir()
 
-        scraper = BisScraper(output_dir, institutions=["Bank of England", "ECB"])
+        scraper = BisScraper(
+            output_dir, institutions=["Bank of England", "ECB"], request_interval=0
+        )
         date_obj = datetime.date(2023, 1, 1)
 
         key = scraper._get_date_cache_key(date_obj)
         assert key == "2023-01-01|Bank of England,ECB"
+        scraper.close()
 
-    @patch("requests.get")
+    @patch("requests.Session.get")
     def test_scrape_date_uses_cache(self, mock_get: MagicMock, tmp_path: Path) -> None:
         """Test that scrape_date skips dates found in cache."""
         output_dir = tmp_path / "output"
         output_dir.mkdir()
 
-        scraper = BisScraper(output_dir)
+        scraper = BisScraper(output_dir, request_interval=0)
 
         # Add a date to the cache
         date_obj = datetime.date(2023, 1, 1)
@@ -124,8 +168,9 @@ class TestDateCache:
         # Should update skipped count
         assert scraper.result.skipped == 3
         assert result is True
+        scraper.close()
 
-    @patch("requests.get")
+    @patch("requests.Session.get")
     def test_scrape_date_updates_cache(
         self, mock_get: MagicMock, tmp_path: Path
     ) -> None:
@@ -133,7 +178,7 @@ class TestDateCache:
         output_dir = tmp_path / "output"
         output_dir.mkdir()
 
-        scraper = BisScraper(output_dir)
+        scraper = BisScraper(output_dir, request_interval=0)
 
         # Mock a 404 response (no speeches for this date)
         mock_response = MagicMock()
@@ -148,13 +193,45 @@ class TestDateCache:
         assert cache_key in scraper.checked_dates
         assert scraper.checked_dates[cache_key]["had_speeches"] is False
         assert scraper.checked_dates[cache_key]["files_found"] == 0
+        scraper.close()
+
+    @patch("requests.Session.get")
+    def test_empty_date_reused_across_filters(
+        self, mock_get: MagicMock, tmp_path: Path
+    ) -> None:
+        """Test that a date without speeches is skipped for any institution filter."""
+        output_dir = tmp_path / "output"
+        output_dir.mkdir()
+
+        # Mock a 404 response for the first letter (no speeches for this date)
+        mock_response = MagicMock()
+        mock_response.status_code = 404
+        mock_get.return_value = mock_response
+
+        date_obj = datetime.date(2023, 1, 1)
+        scraper = BisScraper(
+            output_dir, institutions=["Bank of England"], request_interval=0
+        )
+        scraper.scrape_date(date_obj)
+        scraper.get_results()
+
+        # The empty date is also recorded without the institution filter
+        assert scraper.checked_dates["2023-01-01"]["empty"] is True
+
+        # A run with a different filter does not request the date again
+        mock_get.reset_mock()
+        scraper2 = BisScraper(output_dir, institutions=["ECB"], request_interval=0)
+        assert scraper2.scrape_date(date_obj) is True
+        mock_get.assert_not_called()
+        scraper.close()
+        scraper2.close()
 
     def test_force_download_ignores_cache(self, tmp_path: Path) -> None:
         """Test that force_download ignores the date cache."""
         output_dir = tmp_path / "output"
         output_dir.mkdir()
 
-        scraper = BisScraper(output_dir, force_download=True)
+        scraper = BisScraper(output_dir, force_download=True, request_interval=0)
 
         # Add a date to the cache
         date_obj = datetime.date(2023, 1, 1)
@@ -166,5 +243,7 @@ class TestDateCache:
         }
 
         # With force_download=True, the cache should not be loaded
-        scraper2 = BisScraper(output_dir, force_download=True)
+        scraper2 = BisScraper(output_dir, force_download=True, request_interval=0)
         assert scraper2.checked_dates == {}
+        scraper.close()
+        scraper2.close()
@@ -41,6 +41,20 @@ class TestDateUtils(unittest.TestCase):
         self.assertEqual(date_list[0], "200101")
         self.assertEqual(date_list[-1], "200110")
 
+    def test_create_date_list_matches_strftime(self) -> None:
+        """Test create_date_list across leap days and the century boundary."""
+        start_date = datetime.date(1999, 12, 1)
+        end_date = datetime.date(2000, 3, 31)
+        expected = [
+            (start_date + datetime.timedelta(days=i)).strftime("%y%m%d")
+            for i in range((end_date - start_date).days + 1)
+        ]
+
+        date_list = create_date_list(start_date, end_date)
+
+        self.assertEqual(date_list, expected)
+        self.assertIn("000229", date_list)
+
     def test_create_date_list_invalid_range(self) -> None:
         """Test create_date_list with invalid date range."""
         # End date before start date
@@ -62,6 +76,11 @@ class TestDateUtils(unittest.TestCase):
         self.assertEqual(date, datetime.date(2020, 12, 31))
         self.assertEqual(letter, "z")
 
+        # Test standard format with a pre-2000 date
+        date, letter = parse_date_code("970106a")
+        self.assertEqual(date, datetime.date(1997, 1, 6))
+        self.assertEqual(letter, "a")
+
     def test_parse_date_code_invalid(self) -> None:
         """Test parse_date_code with invalid input."""
         # Invalid length
@@ -76,6 +95,10 @@ class TestDateUtils(unittest.TestCase):
         with self.assertRaises(ValueError):
             parse_date_code("a209901")  # No 99th month
 
+        # Non-digit date part
+        with self.assertRaises(ValueError):
+            parse_date_code("a20o101")
+
     def test_format_date_for_filename(self) -> None:
         """Test format_date_for_filename."""
         # Test normal case
@@ -1,9 +1,12 @@
 """Unit tests for file utilities."""
 
+import datetime
 import tempfile
 import unittest
 from pathlib import Path
+from unittest.mock import patch
 
+from bis_scraper.utils import file_utils
 from bis_scraper.utils.file_utils import (
     create_directory,
     find_existing_files,
@@ -11,9 +14,14 @@ from bis_scraper.utils.file_utils import (
     get_file_hash,
     get_institution_directory,
     list_directories,
+    load_metadata_json,
     normalize_institution_name,
+    save_metadata_to_json,
+    write_metadata_json,
 )
 
+METADATA_TEXT = "Speech by Ms Jane Doe, President of the European Central Bank"
+
 
 class TestFileUtils(unittest.TestCase):
     """Test file utility functions."""
@@ -158,6 +166,67 @@ class TestFileUtils(unittest.TestCase):
             format_filename("220102b", "European Central Bank"), "220102b.pdf"
         )
 
+    def test_load_metadata_json_is_cached(self) -> None:
+        """Test that unchanged metadata.json files are not parsed again."""
+        write_metadata_json(self.temp_dir, {"220101a": {"raw_text": "a"}})
+
+        with patch.object(
+            file_utils, "load_json_file", wraps=file_utils.load_json_file
+        ) as mock_load:
+            data = load_metadata_json(self.temp_dir)
+            data["220102a"] = {"raw_text": "b"}  # Must not leak into the cache
+            self.assertEqual(
+                load_metadata_json(self.temp_dir), {"220101a": {"raw_text": "a"}}
+            )
+            mock_load.assert_not_called()
+
+            # A file rewritten behind the cache's back is parsed again
+            (self.temp_dir / "metadata.json").write_text(
+                '{"220103a": {"raw_text": "changed"}}'
+            )
+            self.assertEqual(
+                load_metadata_json(self.temp_dir),
+                {"220103a": {"raw_text": "changed"}},
+            )
+            mock_load.assert_called_once()
+
+    def _save_and_count_writes(
+        self, metadata_text: str, date_obj: datetime.date
+    ) -> int:
+        """Save a metadata entry over an existing one and count file writes."""
+        save_metadata_to_json(
+            self.temp_dir, "220101a", METADATA_TEXT, datetime.date(2022, 1, 1)
+        )
+        with patch.object(
+            file_utils, "write_metadata_json", wraps=file_utils.write_metadata_json
+        ) as mock_write:
+            save_metadata_to_json(self.temp_dir, "220101a", metadata_text, date_obj)
+        return mock_write.call_count
+
+    def test_save_metadata_to_json_skips_unchanged_entry(self) -> None:
+        """Test that an entry with the same raw text and date is not rewritten."""
+        writes = self._save_and_count_writes(METADATA_TEXT, datetime.date(2022, 1, 1))
+
+        self.assertEqual(writes, 0)
+
+    def test_save_metadata_to_json_rewrites_changed_text(self) -> None:
+        """Test that an entry with different raw text is rewritten."""
+        writes = self._save_and_count_writes(
+            "Remarks by Mr John Smith", datetime.date(2022, 1, 1)
+        )
+
+        self.assertEqual(writes, 1)
+        entry = load_metadata_json(self.temp_dir)["220101a"]
+        self.assertEqual(entry["raw_text"], "Remarks by Mr John Smith")
+
+    def test_save_metadata_to_json_rewrites_changed_date(self) -> None:
+        """Test that an entry with a different date is rewritten."""
+        writes = self._save_and_count_writes(METADATA_TEXT, datetime.date(2022, 1, 2))
+
+        self.assertEqual(writes, 1)
+        entry = load_metadata_json(self.temp_dir)["220101a"]
+        self.assertEqual(entry["date"], "2022-01-02")
+
 
 if __name__ == "__main__":
     unittest.main()
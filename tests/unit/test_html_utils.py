@@ -0,0 +1,64 @@
+"""Unit tests for HTML utilities."""
+
+import unittest
+from unittest.mock import patch
+
+from bis_scraper.utils.html_utils import _parse_metadata_text, extract_metadata_text
+
+SPEECH_PAGE = """<html><head><title>BIS - Speech</title></head><body>
+<h1>Monetary policy</h1>
+<div id="extratitle-div">
+<p>Speech by Mr John Smith, Governor of the Bank of England, at the
+<b>Annual Conference</b>, London, 3 May 2024.</p>
+</div>
+</body></html>"""
+
+
+class TestHtmlUtils(unittest.TestCase):
+    """Test HTML utility functions."""
+
+    def _check_backend(self) -> None:
+        """Check metadata extraction with the currently selected parser."""
+        self.assertEqual(
+            _parse_metadata_text(SPEECH_PAGE),
+            "Speech by Mr John Smith, Governor of the Bank of England, at the\n"
+            "Annual Conference, London, 3 May 2024.",
+        )
+
+        # Without the metadata element the whole page text is used
+        text = _parse_metadata_text("<html><body><p>No metadata</p></body></html>")
+        self.assertEqual(text.strip(), "No metadata")
+
+        self.assertEqual(_parse_metadata_text("").strip(), "")
+
+    def test_extract_metadata_text(self) -> None:
+        """Test that the regex fast path gives the same text as the parser."""
+        page = SPEECH_PAGE.replace("Annual Conference", "Q&amp;A session")
+        with patch("bis_scraper.utils.html_utils._parse_metadata_text") as mock_parse:
+            text = extract_metadata_text(page)
+        mock_parse.assert_not_called()
+        self.assertEqual(text, _parse_metadata_text(page))
+        self.assertIn("Q&A session", text)
+
+    def test_extract_metadata_text_nested_div(self) -> None:
+        """Test that metadata elements with nested divs are parsed as HTML."""
+        page = SPEECH_PAGE.replace("<p>", "<div><p>").replace("</p>", "</p></div>")
+
+        self.assertEqual(
+            extract_metadata_text(page),
+            "Speech by Mr John Smith, Governor of the Bank of England, at the\n"
+            "Annual Conference, London, 3 May 2024.",
+        )
+
+    def test_parse_metadata_text(self) -> None:
+        """Test extraction with the default parser."""
+        self._check_backend()
+
+    def test_parse_metadata_text_without_lxml(self) -> None:
+        """Test extraction with the BeautifulSoup fallback."""
+        with patch("bis_scraper.utils.html_utils._HAS_LXML", False):
+            self._check_backend()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,56 @@
+"""Unit tests for HTTP utilities."""
+
+import unittest
+from unittest.mock import MagicMock, patch
+
+from bis_scraper.utils.http_utils import (
+    RETRY_STATUS_CODES,
+    USER_AGENT,
+    RateLimiter,
+    create_session,
+)
+
+
+class TestHttpUtils(unittest.TestCase):
+    """Test HTTP utility functions."""
+
+    def test_create_session(self) -> None:
+        """Test that sessions are created with pooling, retries and a User-Agent."""
+        session = create_session(pool_maxsize=16, retries=2)
+
+        self.assertEqual(session.headers["User-Agent"], USER_AGENT)
+
+        adapter = session.get_adapter("https://www.bis.org/review/r200101a.htm")
+        self.assertEqual(adapter._pool_maxsize, 16)
+        self.assertEqual(adapter.max_retries.total, 2)
+        self.assertEqual(
+            set(adapter.max_retries.status_forcelist),
+            set(RETRY_STATUS_CODES),
+        )
+
+    @patch("bis_scraper.utils.http_utils.time.sleep")
+    @patch("bis_scraper.utils.http_utils.time.monotonic", return_value=100.0)
+    def test_rate_limiter_spaces_requests(
+        self, mock_monotonic: MagicMock, mock_sleep: MagicMock
+    ) -> None:
+        """Test that back-to-back requests are given consecutive time slots."""
+        limiter = RateLimiter(0.25)
+
+        limiter.wait()  # First request starts immediately
+        limiter.wait()
+        limiter.wait()
+
+        self.assertEqual([c.args[0] for c in mock_sleep.call_args_list], [0.25, 0.5])
+
+    @patch("bis_scraper.utils.http_utils.time.sleep")
+    def test_rate_limiter_disabled(self, mock_sleep: MagicMock) -> None:
+        """Test that an interval of 0 never sleeps."""
+        limiter = RateLimiter(0)
+        limiter.wait()
+        limiter.wait()
+
+        mock_sleep.assert_not_called()
+
+
+if __name__ == "__main__":
+    unittest.main()
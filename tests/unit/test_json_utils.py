@@ -0,0 +1,90 @@
+"""Unit tests for JSON utilities."""
+
+import tempfile
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+from bis_scraper.utils.json_utils import (
+    append_json_lines,
+    dump_json_file,
+    load_json_file,
+    load_json_lines,
+)
+
+
+class TestJsonUtils(unittest.TestCase):
+    """Test JSON utility functions."""
+
+    def setUp(self) -> None:
+        """Set up test fixtures."""
+        self.temp_dir = Path(tempfile.mkdtemp())
+
+    def tearDown(self) -> None:
+        """Tear down test fixtures."""
+        import shutil
+
+        if self.temp_dir.exists():
+            shutil.rmtree(self.temp_dir)
+
+    def test_load_json_file(self) -> None:
+        """Test loading a UTF-8 encoded JSON file."""
+        json_file = self.temp_dir / "data.json"
+        json_file.write_text('{"name": "Banque de France", "count": 2}', "utf-8")
+
+        data = load_json_file(json_file)
+
+        self.assertEqual(data, {"name": "Banque de France", "count": 2})
+
+    def test_load_invalid_json_file(self) -> None:
+        """Test that invalid JSON raises ValueError."""
+        json_file = self.temp_dir / "data.json"
+        json_file.write_text("{not json", "utf-8")
+
+        with self.assertRaises(ValueError):
+            load_json_file(json_file)
+
+    def test_dump_json_file(self) -> None:
+        """Test writing JSON that round-trips with non-ASCII text kept as-is."""
+        json_file = self.temp_dir / "data.json"
+        data = {"200101a": {"raw_text": "Banco de España", "date": "2020-01-01"}}
+
+        dump_json_file(json_file, data)
+
+        self.assertIn("Banco de España", json_file.read_text("utf-8"))
+        self.assertEqual(load_json_file(json_file), data)
+
+    def test_dump_json_file_failure_keeps_original(self) -> None:
+        """Test that a failed write leaves the old file and no temporary file."""
+        json_file = self.temp_dir / "data.json"
+        dump_json_file(json_file, {"old": 1})
+
+        with patch("os.replace", side_effect=OSError("Disk full")):
+            with self.assertRaises(OSError):
+                dump_json_file(json_file, {"new": 2})
+
+        self.assertEqual(load_json_file(json_file), {"old": 1})
+        self.assertEqual([p.name for p in self.temp_dir.iterdir()], ["data.json"])
+
+    def test_append_json_lines(self) -> None:
+        """Test that appended values are read back in order, one per line."""
+        lines_file = self.temp_dir / "data.ndjson"
+
+        append_json_lines(lines_file, [{"key": "a"}, {"key": "b"}])
+        append_json_lines(lines_file, [{"key": "c"}])
+
+        self.assertEqual(len(lines_file.read_text("utf-8").splitlines()), 3)
+        self.assertEqual(
+            load_json_lines(lines_file), [{"key": "a"}, {"key": "b"}, {"key": "c"}]
+        )
+
+    def test_load_json_lines_skips_truncated_line(self) -> None:
+        """Test that a partially written last line is ignored."""
+        lines_file = self.temp_dir / "data.ndjson"
+        lines_file.write_text('{"key": "a"}\n{"key": "b"}\n{"key": ', "utf-8")
+
+        self.assertEqual(load_json_lines(lines_file), [{"key": "a"}, {"key": "b"}])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,5 +1,6 @@
 """Unit tests for PDF converter."""
 
+import os
 import tempfile
 import unittest
 from pathlib import Path
@@ -7,6 +8,23 @@ from unittest.mock import patch
 
 from bis_scraper.converters.pdf_converter import PdfConverter
 
+# Minimal single-page PDF with a text object that pdfium can extract
+_TEXT_STREAM = b"BT /F1 12 Tf 72 712 Td (Sample speech text) Tj ET"
+SAMPLE_TEXT_PDF = (
+    b"%PDF-1.4\n"
+    b"1 0 obj<</Type/Catalog/Pages 2 0 R>>endobj\n"
+    b"2 0 obj<</Type/Pages/Kids[3 0 R]/Count 1>>endobj\n"
+    b"3 0 obj<</Type/Page/Parent 2 0 R/MediaBox[0 0 612 792]"
+    b"/Resources<</Font<</F1 5 0 R>>>>/Contents 4 0 R>>endobj\n"
+    b"4 0 obj<</Length "
+    + str(len(_TEXT_STREAM)).encode()
+    + b">>stream\n"
+    + _TEXT_STREAM
+    + b"\nendstream\nendobj\n"
+    b"5 0 obj<</Type/Font/Subtype/Type1/BaseFont/Helvetica>>endobj\n"
+    b"trailer<</Root 1 0 R>>\n%%EOF"
+)
+
 
 class TestPdfConverter(unittest.TestCase):
     """Test PDF converter class."""
@@ -52,6 +70,8 @@ class TestPdfConverter(unittest.TestCase):
             input_dir=self.input_dir,
             output_dir=self.output_dir,
             institutions=["European Central Bank"],
+            workers=1,
+            backend="textract",
         )
 
         # Convert for ECB
@@ -80,7 +100,11 @@ class TestPdfConverter(unittest.TestCase):
 
         # Initialize converter with limit=1
         converter = PdfConverter(
-            input_dir=self.input_dir, output_dir=self.output_dir, limit=1
+            input_dir=self.input_dir,
+            output_dir=self.output_dir,
+            limit=1,
+            workers=1,
+            backend="textract",
         )
 
         # Convert for ECB
@@ -116,6 +140,8 @@ class TestPdfConverter(unittest.TestCase):
             input_dir=self.input_dir,
             output_dir=self.output_dir,
             institutions=["European Central Bank"],
+            workers=1,
+            backend="textract",
         )
 
         # Convert for ECB
@@ -134,6 +160,39 @@ class TestPdfConverter(unittest.TestCase):
             content = f.read()
         self.assertEqual(content, "Existing content")
 
+    @patch("textract.process")
+    def test_reconvert_stale_files(self, mock_process) -> None:
+        """Test re-converting PDFs that are newer than their text files."""
+        mock_process.return_value = b"New content"
+
+        # Create an output file that is older than its PDF
+        ecb_output_dir = self.output_dir / "european_central_bank"
+        ecb_output_dir.mkdir(exist_ok=True, parents=True)
+        stale_file = ecb_output_dir / "220101a.txt"
+        stale_file.write_text("Stale content")
+        pdf_mtime = (self.ecb_dir / "220101a.pdf").stat().st_mtime
+        os.utime(stale_file, (pdf_mtime - 60, pdf_mtime - 60))
+
+        # Create an up-to-date output file for the other PDF
+        (ecb_output_dir / "220102b.txt").write_text("Existing content")
+
+        converter = PdfConverter(
+            input_dir=self.input_dir,
+            output_dir=self.output_dir,
+            institutions=["European Central Bank"],
+            workers=1,
+            backend="textract",
+        )
+
+        converter.convert_institution("european_central_bank")
+
+        # Only the stale file should have been converted again
+        result = converter.get_results()
+        self.assertEqual(result.successful, 1)
+        self.assertEqual(result.skipped, 1)
+        self.assertEqual(mock_process.call_count, 1)
+        self.assertEqual(stale_file.read_text(), "New content")
+
     @patch("textract.process")
     def test_force_convert(self, mock_process) -> None:
         """Test force converting existing files."""
@@ -153,6 +212,8 @@ class TestPdfConverter(unittest.TestCase):
             output_dir=self.output_dir,
             institutions=["European Central Bank"],
             force_convert=True,
+            workers=1,
+            backend="textract",
         )
 
         # Convert for ECB
@@ -188,6 +249,8 @@ class TestPdfConverter(unittest.TestCase):
             institutions=["European Central Bank"],
             start_date=_dt.date(2022, 1, 2),
             end_date=_dt.date(2022, 1, 2),
+            workers=1,
+            backend="textract",
         )
 
         converter.convert_institution("european_central_bank")
@@ -219,10 +282,13 @@ class TestPdfConverter(unittest.TestCase):
             input_dir=self.input_dir,
             output_dir=self.output_dir,
             institutions=["European Central Bank"],
+            workers=1,
+            backend="textract",
         )
 
-        # Convert for ECB - error should be handled internally
-        converter.convert_institution("european_central_bank")
+        # Convert for ECB - error should be handled internally and logged
+        with self.assertLogs("bis_scraper.converters.pdf_converter") as logs:
+            converter.convert_institution("european_central_bank")
 
         # Check results
         result = converter.get_results()
@@ -230,6 +296,123 @@ class TestPdfConverter(unittest.TestCase):
         self.assertEqual(result.failed, 1)  # Second file failed
         self.assertIn("220102b", result.errors)  # Error recorded
 
+        output = "\n".join(logs.output)
+        self.assertIn("Converted 220101a to 220101a.txt", output)
+        self.assertIn("Error converting 220102b: Test conversion error", output)
+        self.assertIn("Traceback (most recent call last)", output)
+        self.assertIn("european_central_bank: converted 1, skipped 0, failed 1", output)
+
+    @patch("textract.process")
+    def test_convert_with_pdfium_backend(self, mock_process) -> None:
+        """Test converting PDFs with the default pdfium backend."""
+        mock_process.side_effect = Exception("Test textract error")
+        (self.ecb_dir / "220101a.pdf").write_bytes(SAMPLE_TEXT_PDF)
+
+        converter = PdfConverter(
+            input_dir=self.input_dir,
+            output_dir=self.output_dir,
+            institutions=["European Central Bank"],
+            workers=1,
+        )
+
+        converter.convert_institution("european_central_bank")
+
+        # The valid PDF is converted, the empty placeholder file fails
+        result = converter.get_results()
+        self.assertEqual(result.successful, 1)
+        self.assertEqual(result.failed, 1)
+        self.assertIn("220102b", result.errors)
+
+        ecb_output_dir = self.output_dir / "european_central_bank"
+        txt_file = ecb_output_dir / "220101a.txt"
+        self.assertEqual(txt_file.read_text(encoding="utf-8"), "Sample speech text")
+
+        # No partial output is left behind for the failed conversion
+        self.assertFalse((ecb_output_dir / "220102b.txt").exists())
+
+        # textract was only tried as a fallback for the unreadable file
+        mock_process.assert_called_once_with(str(self.ecb_dir / "220102b.pdf"))
+
+    @patch("textract.process")
+    def test_pdfium_textract_fallback(self, mock_process) -> None:
+        """Test falling back to textract for PDFs that pdfium cannot read."""
+        mock_process.return_value = b"Fallback content"
+
+        converter = PdfConverter(
+            input_dir=self.input_dir,
+            output_dir=self.output_dir,
+            institutions=["European Central Bank"],
+            workers=1,
+        )
+
+        converter.convert_institution("european_central_bank")
+
+        # The empty placeholder files are rejected by pdfium but read by textract
+        result = converter.get_results()
+        self.assertEqual(result.successful, 2)
+        self.assertEqual(result.failed, 0)
+
+        txt_file = self.output_dir / "european_central_bank" / "220101a.txt"
+        self.assertEqual(txt_file.read_text(encoding="utf-8"), "Fallback content")
+
+    @patch("textract.process", side_effect=Exception("Unreadable"))
+    def test_failed_reconversion_keeps_existing_text(self, mock_process) -> None:
+        """Test that a failed forced reconversion leaves the old text file intact."""
+        ecb_output_dir = self.output_dir / "european_central_bank"
+        ecb_output_dir.mkdir(parents=True)
+        existing_file = ecb_output_dir / "220101a.txt"
+        existing_file.write_text("Existing content", encoding="utf-8")
+
+        converter = PdfConverter(
+            input_dir=self.input_dir,
+            output_dir=self.output_dir,
+            institutions=["European Central Bank"],
+            force_convert=True,
+            workers=1,
+        )
+
+        # The empty placeholder PDFs are rejected by pdfium and textract alike
+        converter.convert_institution("european_central_bank")
+
+        self.assertEqual(converter.get_results().failed, 2)
+        self.assertEqual(existing_file.read_text(encoding="utf-8"), "Existing content")
+        self.assertEqual(
+            sorted(p.name for p in ecb_output_dir.iterdir()), ["220101a.txt"]
+        )
+
+    def test_invalid_backend(self) -> None:
+        """Test that an unsupported backend is rejected."""
+        with self.assertRaises(ValueError):
+            PdfConverter(
+                input_dir=self.input_dir,
+                output_dir=self.output_dir,
+                backend="unknown",
+            )
+
+    def test_convert_with_process_pool(self) -> None:
+        """Test that results from worker processes are merged into the result."""
+        (self.ecb_dir / "220101a.pdf").write_bytes(SAMPLE_TEXT_PDF)
+        (self.ecb_dir / "220102b.pdf").write_bytes(SAMPLE_TEXT_PDF)
+
+        converter = PdfConverter(
+            input_dir=self.input_dir,
+            output_dir=self.output_dir,
+            institutions=["European Central Bank"],
+            workers=2,
+        )
+
+        converter.convert_institution("european_central_bank")
+
+        result = converter.get_results()
+        self.assertEqual(result.successful, 2)
+        self.assertEqual(result.skipped, 0)
+        self.assertEqual(result.failed, 0)
+
+        ecb_output_dir = self.output_dir / "european_central_bank"
+        for file_code in ("220101a", "220102b"):
+            content = (ecb_output_dir / f"{file_code}.txt").read_text(encoding="utf-8")
+            self.assertEqual(content, "Sample speech text")
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -1,10 +1,13 @@
 """Unit tests for recategorize functionality."""
 
+import errno
 import json
 import tempfile
 import unittest
 from pathlib import Path
+from unittest.mock import MagicMock, patch
 
+from bis_scraper.scrapers import recategorize
 from bis_scraper.scrapers.recategorize import recategorize_unknown_files
 from bis_scraper.utils.constants import RAW_DATA_DIR, TXT_DATA_DIR
 
@@ -100,6 +103,134 @@ class TestRecategorize(unittest.TestCase):
         self.assertFalse(self.unknown_dir.exists())
         self.assertFalse(self.unknown_texts_dir.exists())
 
+    def test_metadata_written_in_batches(self) -> None:
+        """Test that the unknown metadata.json is not rewritten after every move."""
+        metadata_data = {}
+        for letter in "abc":
+            code = f"200101{letter}"
+            metadata_data[code] = {
+                "raw_text": "Speech by Mr. John Smith, Governor of the European Central Bank",
+                "date": "2020-01-01",
+            }
+            (self.unknown_dir / f"{code}.pdf").write_bytes(b"%PDF-1.4")
+        # One entry stays unknown, so metadata.json is kept
+        metadata_data["200101d"] = {"raw_text": "Speech by Mr. Nobody", "date": None}
+        (self.unknown_dir / "200101d.pdf").write_bytes(b"%PDF-1.4")
+        metadata_file = self.unknown_dir / "metadata.json"
+        with open(metadata_file, "w", encoding="utf-8") as f:
+            json.dump(metadata_data, f, indent=2)
+
+        with patch(
+            "bis_scraper.scrapers.recategorize.write_metadata_json",
+            wraps=recategorize.write_metadata_json,
+        ) as mock_write:
+            recategorized, remaining = recategorize_unknown_files(self.temp_dir)
+
+        self.assertEqual(recategorized, 3)
+        self.assertEqual(remaining, 1)
+        # All three removals are written with a single rewrite, and so are
+        # the three new entries of the target institution
+        written_dirs = [c.args[0] for c in mock_write.call_args_list]
+        self.assertEqual(
+            sorted(written_dirs),
+            sorted([self.unknown_dir, self.output_dir / "european_central_bank"]),
+        )
+        with open(metadata_file, "r", encoding="utf-8") as f:
+            self.assertEqual(list(json.load(f)), ["200101d"])
+
+    @patch("bis_scraper.scrapers.recategorize.create_session")
+    def test_pdfs_without_metadata_share_session(
+        self, mock_create_session: MagicMock
+    ) -> None:
+        """Test that metadata for PDFs without entries is fetched over one session."""
+        session = mock_create_session.return_value
+        session.get.return_value.text = (
+            '<div id="extratitle-div">Speech by Mr. Nobody</div>'
+        )
+        for letter in "ab":
+            (self.unknown_dir / f"200101{letter}.pdf").write_bytes(b"%PDF-1.4")
+
+        recategorized, remaining = recategorize_unknown_files(
+            self.temp_dir, request_interval=0
+        )
+
+        self.assertEqual(recategorized, 0)
+        self.assertEqual(remaining, 2)
+        mock_create_session.assert_called_once()
+        self.assertEqual(session.get.call_count, 2)
+        session.close.assert_called_once()
+
+    def test_move_file_across_filesystems(self) -> None:
+        """Test that moves fall back to copying when a rename is not possible."""
+        source = self.unknown_dir / "200101a.pdf"
+        source.write_bytes(b"%PDF-1.4")
+        target = self.output_dir / "200101a.pdf"
+
+        with patch(
+            "bis_scraper.scrapers.recategorize.os.replace",
+            side_effect=OSError(errno.EXDEV, "Invalid cross-device link"),
+        ):
+            recategorize._move_file(source, target)
+
+        self.assertFalse(source.exists())
+        self.assertEqual(target.read_bytes(), b"%PDF-1.4")
+
+    def test_failed_lookups_skipped_until_mappings_change(self) -> None:
+        """Test that entries are only looked up again after the mappings change."""
+        metadata_file = self.unknown_dir / "metadata.json"
+        with open(metadata_file, "w", encoding="utf-8") as f:
+            json.dump({"200101a": {"raw_text": "Speech by Mr. Nobody"}}, f)
+        (self.unknown_dir / "200101a.pdf").write_bytes(b"%PDF-1.4")
+
+        self.assertEqual(recategorize_unknown_files(self.temp_dir), (0, 1))
+        with open(metadata_file, "r", encoding="utf-8") as f:
+            entry = json.load(f)["200101a"]
+        self.assertEqual(
+            entry[recategorize.INSTITUTION_LOOKUP_VERSION_KEY],
+            recategorize.INSTITUTION_MAP_VERSION,
+        )
+
+        with patch(
+            "bis_scraper.scrapers.recategorize._institution_for_text",
+            return_value="european central bank",
+        ) as mock_lookup:
+            # Same mappings: the entry is not looked up again
+            self.assertEqual(recategorize_unknown_files(self.temp_dir), (0, 1))
+            mock_lookup.assert_not_called()
+
+            # New mappings: the entry is retried and moved
+            with patch(
+                "bis_scraper.scrapers.recategorize.INSTITUTION_MAP_VERSION", "new"
+            ):
+                self.assertEqual(recategorize_unknown_files(self.temp_dir), (1, 0))
+
+        ecb_metadata_file = self.output_dir / "european_central_bank" / "metadata.json"
+        with open(ecb_metadata_file, "r", encoding="utf-8") as f:
+            self.assertNotIn(
+                recategorize.INSTITUTION_LOOKUP_VERSION_KEY, json.load(f)["200101a"]
+            )
+
+    def test_load_truncated_metadata_file(self) -> None:
+        """Test that complete entries of a truncated metadata.json are recovered."""
+        metadata_file = self.unknown_dir / "metadata.json"
+        content = json.dumps(
+            {
+                "200101a": {"raw_text": "First speech", "date": "2020-01-01"},
+                "200101b": {"raw_text": "Second speech", "date": "2020-01-01"},
+            },
+            indent=2,
+        )
+        # Cut the file off in the middle of the second entry
+        metadata_file.write_text(content[: content.index("Second")], "utf-8")
+
+        self.assertEqual(
+            recategorize._load_metadata_file(metadata_file),
+            {"200101a": {"raw_text": "First speech", "date": "2020-01-01"}},
+        )
+
+        metadata_file.write_text("not json", "utf-8")
+        self.assertEqual(recategorize._load_metadata_file(metadata_file), {})
+
     def test_recategorize_partial(self) -> None:
         """Test partial re-categorization when some files can't be categorized."""
         # Create metadata with one recognizable and one unrecognizable